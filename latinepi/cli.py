@@ -3,20 +3,252 @@
 Main CLI entry point for latinepi tool.
 """
 import argparse
+import csv
 import json
+import os
+import pickle
 import sys
+import tempfile
+from functools import partial
 from pathlib import Path
 
+# orjson is optional; the standard library json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Support both running as script and as module
 try:
-    from latinepi.parser import read_inscriptions, extract_entities
-    from latinepi.edh_utils import download_edh_inscription, search_edh_inscriptions
-    from latinepi.hybrid_parser import extract_entities_hybrid
+    from latinepi.parser import read_inscriptions_counted, extract_entities
+    from latinepi.parallel import iter_batch_results
 except ModuleNotFoundError:
     # Running as script, use relative import
-    from parser import read_inscriptions, extract_entities
-    from edh_utils import download_edh_inscription, search_edh_inscriptions
-    from hybrid_parser import extract_entities_hybrid
+    from parser import read_inscriptions_counted, extract_entities
+    from parallel import iter_batch_results
+
+
+def _import_edh_utils():
+    """
+    Import the EDH API helpers on first use.
+
+    They pull in requests, which takes longer to import than the rest of
+    the CLI, and most runs only process local files.
+    """
+    try:
+        from latinepi import edh_utils
+    except ModuleNotFoundError:
+        import edh_utils
+    return edh_utils
+
+
+def _import_hybrid_parser():
+    """Import the hybrid parser on first use; pattern matching does not need it."""
+    try:
+        from latinepi import hybrid_parser
+    except ModuleNotFoundError:
+        import hybrid_parser
+    return hybrid_parser
+
+
+# Number of inscriptions handed to the extractor at a time
+BATCH_SIZE = 64
+
+# Fields that may hold the inscription text, in order of preference
+TEXT_FIELDS = ('text', 'Text', 'transcription')
+
+
+def _orjson_matches_json(result):
+    """
+    Check that orjson would write a record exactly as json.dumps does.
+
+    That holds for flat records with str keys and str, bool, None, 64-bit
+    int or plainly formatted float values. orjson writes floats in exponent
+    form differently (1e-7, not 1e-07), writes NaN and infinity as null and
+    handles other types json rejects.
+    """
+    for key, value in result.items():
+        if type(key) is not str:
+            return False
+        kind = type(value)
+        if kind is float:
+            # Also False for NaN and infinity
+            if not (value == 0.0 or 1e-4 <= abs(value) < 1e16):
+                return False
+        elif kind is int:
+            if not -2 ** 63 <= value < 2 ** 64:
+                return False
+        elif kind is not str and kind is not bool and value is not None:
+            return False
+    return True
+
+
+def dumps_result(result, indent=False):
+    """
+    Serialize one result record to a JSON string.
+
+    Produces the same text as json.dumps(result, ensure_ascii=False), with
+    indent=2 when indent is True. orjson is used when it is available and
+    would write the record identically; otherwise the standard library.
+    """
+    if orjson is not None and _orjson_matches_json(result):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            return orjson.dumps(result, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # e.g. strings with lone surrogates
+            pass
+    if indent:
+        return json.dumps(result, indent=2, ensure_ascii=False)
+    return json.dumps(result, ensure_ascii=False, separators=(',', ':'))
+
+
+def get_inscription_text(inscription):
+    """Return the first text field present in an inscription record, or ''."""
+    for field in TEXT_FIELDS:
+        if field in inscription:
+            return inscription[field]
+    return ''
+
+
+class JsonResultWriter:
+    """
+    Stream result records to a JSON array file as they are produced.
+
+    The output matches json.dump(results, f, indent=2), without holding
+    the full result list in memory.
+    """
+
+    def __init__(self, output_path):
+        self.count = 0
+        self._file = open(output_path, 'w', encoding='utf-8')
+        self._file.write('[')
+
+    def write(self, result):
+        """Append one record to the array."""
+        record = dumps_result(result, indent=True)
+        self._file.write(',\n' if self.count else '\n')
+        self._file.write('\n'.join('  ' + line for line in record.split('\n')))
+        self.count += 1
+
+    def close(self):
+        """Close the array and the file."""
+        self._file.write('\n]' if self.count else ']')
+        self._file.close()
+
+
+class CsvResultWriter:
+    """
+    Stream result records to a CSV file.
+
+    Records may carry different fields (threshold filtering drops some),
+    so rows are pickled to a temporary file while the set of fieldnames is
+    tracked, and the CSV with its full header is written on close. Pickling
+    keeps every value as it was, so csv.DictWriter formats it exactly as it
+    would the original record.
+    """
+
+    def __init__(self, output_path):
+        self.count = 0
+        self._output_path = output_path
+        self._fieldnames = set()
+        self._spool = tempfile.TemporaryFile()
+
+    def write(self, result):
+        """Spool one record and record its fields."""
+        self._fieldnames.update(result)
+        pickle.dump(result, self._spool, pickle.HIGHEST_PROTOCOL)
+        self.count += 1
+
+    def close(self):
+        """Write the header and spooled rows to the output file."""
+        try:
+            if not self.count:
+                return
+
+            # Sort fieldnames for consistent column ordering
+            # inscription_id first, then alphabetically
+            fieldnames = sorted(self._fieldnames)
+            if 'inscription_id' in fieldnames:
+                fieldnames.remove('inscription_id')
+                fieldnames = ['inscription_id'] + fieldnames
+
+            self._spool.seek(0)
+            with open(self._output_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                for _ in range(self.count):
+                    writer.writerow(pickle.load(self._spool))
+        finally:
+            self._spool.close()
+
+
+def extract_batch(texts, use_hybrid, use_morphology, use_dependencies,
+                  min_confidence, verbose, parse_cache_dir=None):
+    """
+    Extract entities from a batch of texts with the selected parser.
+
+    Defined at module level so it can be sent to worker processes.
+
+    Returns:
+        List of entity dictionaries, in the same order as texts
+    """
+    if use_hybrid:
+        return _import_hybrid_parser().extract_entities_hybrid_batch(
+            texts,
+            use_morphology=use_morphology,
+            use_dependencies=use_dependencies,
+            min_confidence=min_confidence,
+            verbose=verbose,
+            parse_cache_dir=parse_cache_dir
+        )
+    return [extract_entities(text) for text in texts]
+
+
+def iter_pending(inscriptions):
+    """
+    Yield (index, inscription, text) for inscriptions with text.
+
+    Inscriptions without text are skipped with a warning.
+    """
+    for i, inscription in enumerate(inscriptions, start=1):
+        # Get the text field from the inscription
+        text = get_inscription_text(inscription)
+
+        if not text:
+            print(f"Warning: Inscription {i} has no 'text' field, skipping", file=sys.stderr)
+            continue
+
+        yield i, inscription, text
+
+
+def _extract_pending_batch(batch, **options):
+    """Extract entities for a batch of (index, inscription, text) tuples."""
+    return extract_batch([text for _, _, text in batch], **options)
+
+
+def iter_extracted_batches(pending, workers, **options):
+    """
+    Yield (batch, entities) pairs for pending inscriptions, in input order.
+
+    With more than one worker, batches are extracted in a process pool,
+    keeping at most two batches per worker in flight to bound memory.
+
+    Args:
+        pending: Iterable of (index, inscription, text) tuples
+        workers: Number of worker processes (1 runs in this process)
+        **options: Keyword arguments passed to extract_batch
+    """
+    preload = None
+    preload_args = ()
+    if options['use_hybrid']:
+        # Load CLTK models once here; forked workers share them copy-on-write
+        preload = _import_hybrid_parser().preload_cltk
+        preload_args = (options['use_morphology'], options['use_dependencies'])
+    return iter_batch_results(
+        partial(_extract_pending_batch, **options), pending, workers, BATCH_SIZE,
+        preload=preload, preload_args=preload_args
+    )
 
 
 def create_parser():
@@ -104,6 +336,20 @@ For more information, see: https://github.com/yourrepo/latinitas
         help='Enable dependency parsing for complex inscriptions (requires CLTK)'
     )
 
+    extraction_group.add_argument(
+        '--parse-cache',
+        metavar='<directory>',
+        help='Cache dependency parsing results in this directory across runs'
+    )
+
+    extraction_group.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        metavar='<n>',
+        help='Worker processes for entity extraction (default: 1, 0 = one per CPU)'
+    )
+
     extraction_group.add_argument(
         '--verbose',
         action='store_true',
@@ -124,6 +370,18 @@ For more information, see: https://github.com/yourrepo/latinitas
         help='Directory for downloaded files (required with --download-edh)'
     )
 
+    edh_group.add_argument(
+        '--compact-json',
+        action='store_true',
+        help='Write downloaded JSON files without indentation (smaller, faster)'
+    )
+
+    edh_group.add_argument(
+        '--edh-cache',
+        metavar='<directory>',
+        help='Cache EDH API responses in this directory for 24 hours and reuse them on re-runs'
+    )
+
     # EDH search group
     search_group = parser.add_argument_group('EDH Search Options')
     search_group.add_argument(
@@ -218,6 +476,12 @@ def validate_args(args, parser):
         print(f"       Got: {args.confidence_threshold}", file=sys.stderr)
         sys.exit(1)
 
+    # Validate worker count
+    if args.workers < 0:
+        print("Error: --workers must be 0 or greater", file=sys.stderr)
+        print(f"       Got: {args.workers}", file=sys.stderr)
+        sys.exit(1)
+
     # Check for --download-dir without --download-edh or --search-edh
     if args.download_dir and not args.download_edh and not args.search_edh:
         print("Warning: --download-dir specified without --download-edh or --search-edh (will be ignored)", file=sys.stderr)
@@ -247,6 +511,9 @@ def validate_args(args, parser):
         if args.flag_ambiguous:
             print("Warning: --flag-ambiguous specified without --input (will be ignored)", file=sys.stderr)
 
+    if args.parse_cache and not args.use_dependencies:
+        print("Warning: --parse-cache specified without --use-dependencies (will be ignored)", file=sys.stderr)
+
 
 def main():
     """Main entry point for the CLI."""
@@ -266,7 +533,10 @@ def main():
     if args.download_edh:
         try:
             print(f"Downloading inscription {args.download_edh} from EDH API...", file=sys.stderr)
-            output_file = download_edh_inscription(args.download_edh, args.download_dir)
+            output_file = _import_edh_utils().download_edh_inscription(
+                args.download_edh, args.download_dir,
+                compact=args.compact_json, cache_dir=args.edh_cache
+            )
             print(f"Successfully downloaded inscription {args.download_edh} to {output_file}")
 
             # If no input file specified, we're done after download
@@ -294,11 +564,13 @@ def main():
             'year_to': args.search_year_to,
             'max_results': args.search_limit,
             'workers': args.search_workers,
-            'resume': not args.no_resume
+            'resume': not args.no_resume,
+            'compact': args.compact_json,
+            'cache_dir': args.edh_cache
         }
 
         try:
-            downloaded_files = search_edh_inscriptions(**search_params)
+            downloaded_files = _import_edh_utils().search_edh_inscriptions(**search_params)
             print(f"Successfully downloaded {len(downloaded_files)} inscriptions to {args.download_dir}")
 
             # If no input file specified, we're done after search
@@ -313,8 +585,10 @@ def main():
             sys.exit(1)
 
     # Read inscriptions from input file
+    # Count the records first, so input errors are reported before any
+    # output is written; the records themselves are streamed below
     try:
-        inscriptions = read_inscriptions(args.input)
+        total, inscriptions = read_inscriptions_counted(args.input)
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -325,9 +599,17 @@ def main():
         print(f"Error: Could not read input file '{args.input}': {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Process each inscription and extract entities
-    results = []
-    total = len(inscriptions)
+    # Process each inscription and extract entities, streaming results
+    # to the output file as they are produced
+    output_path = Path(args.output)
+    try:
+        if args.output_format == 'json':
+            writer = JsonResultWriter(output_path)
+        else:  # csv
+            writer = CsvResultWriter(output_path)
+    except Exception as e:
+        print(f"Error: Could not write to output file '{args.output}': {e}", file=sys.stderr)
+        sys.exit(1)
 
     # Determine which parser to use
     use_hybrid = args.use_grammar or args.use_morphology or args.use_dependencies
@@ -344,94 +626,70 @@ def main():
 
     print(f"Processing {total} inscription(s)...")
 
-    for i, inscription in enumerate(inscriptions, start=1):
-        # Get the text field from the inscription
-        text = inscription.get('text', inscription.get('Text', inscription.get('transcription', '')))
-
-        if not text:
-            print(f"Warning: Inscription {i} has no 'text' field, skipping", file=sys.stderr)
-            continue
+    pending = iter_pending(inscriptions)
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    extracted = iter_extracted_batches(
+        pending,
+        workers,
+        use_hybrid=use_hybrid,
+        use_morphology=args.use_grammar or args.use_morphology,
+        use_dependencies=args.use_dependencies,
+        min_confidence=args.confidence_threshold,
+        verbose=args.verbose,
+        parse_cache_dir=args.parse_cache
+    )
 
-        # Extract entities from the text
-        if use_hybrid:
-            # Use hybrid parser
-            use_morph = args.use_grammar or args.use_morphology
-            use_deps = args.use_dependencies
-            entities = extract_entities_hybrid(
-                text,
-                use_morphology=use_morph,
-                use_dependencies=use_deps,
-                min_confidence=args.confidence_threshold,
-                verbose=args.verbose
-            )
-        else:
-            # Use original pattern-based parser
-            entities = extract_entities(text)
-
-        # Create result record with original ID if available and extracted entities
-        result = {}
-        if 'id' in inscription:
-            result['inscription_id'] = inscription['id']
-        elif 'Id' in inscription:
-            result['inscription_id'] = inscription['Id']
-
-        # Apply confidence threshold filtering and flatten the entity structure for output
-        for entity_name, entity_data in entities.items():
-            confidence = entity_data['confidence']
-
-            # Check if entity meets confidence threshold
-            if confidence < args.confidence_threshold:
-                if args.flag_ambiguous:
-                    # Include entity with ambiguous flag
+    # Bind loop-invariant values once
+    threshold = args.confidence_threshold
+    flag_ambiguous = args.flag_ambiguous
+    write_result = writer.write
+
+    for batch, batch_entities in extracted:
+        for (i, inscription, _), entities in zip(batch, batch_entities):
+            # Create result record with original ID if available and extracted entities
+            result = {}
+            if 'id' in inscription:
+                result['inscription_id'] = inscription['id']
+            elif 'Id' in inscription:
+                result['inscription_id'] = inscription['Id']
+
+            # Apply confidence threshold filtering and flatten the entity structure for output
+            for entity_name, entity_data in entities.items():
+                confidence = entity_data['confidence']
+
+                # Check if entity meets confidence threshold
+                if confidence < threshold:
+                    if flag_ambiguous:
+                        # Include entity with ambiguous flag
+                        result[entity_name] = entity_data['value']
+                        result[f"{entity_name}_confidence"] = confidence
+                        result[f"{entity_name}_ambiguous"] = True
+                    else:
+                        # Omit entity from results (skip to next entity)
+                        continue
+                else:
+                    # Entity meets threshold, include it
                     result[entity_name] = entity_data['value']
                     result[f"{entity_name}_confidence"] = confidence
-                    result[f"{entity_name}_ambiguous"] = True
-                else:
-                    # Omit entity from results (skip to next entity)
-                    continue
-            else:
-                # Entity meets threshold, include it
-                result[entity_name] = entity_data['value']
-                result[f"{entity_name}_confidence"] = confidence
 
-        results.append(result)
+            try:
+                write_result(result)
+            except Exception as e:
+                print(f"Error: Could not write to output file '{args.output}': {e}", file=sys.stderr)
+                sys.exit(1)
 
-        # Print progress
-        print(f"Processed inscription {i}/{total}")
+            # Print progress
+            print(f"Processed inscription {i}/{total}")
 
-    # Write results to output file
-    output_path = Path(args.output)
+    # Finish writing results to output file
     try:
-        if args.output_format == 'json':
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-        else:  # csv
-            import csv
-            if results:
-                # Collect all unique fieldnames from all records
-                # (different records may have different fields due to threshold filtering)
-                all_fieldnames = set()
-                for result in results:
-                    all_fieldnames.update(result.keys())
-
-                # Sort fieldnames for consistent column ordering
-                # inscription_id first, then alphabetically
-                fieldnames = sorted(all_fieldnames)
-                if 'inscription_id' in fieldnames:
-                    fieldnames.remove('inscription_id')
-                    fieldnames = ['inscription_id'] + fieldnames
-
-                with open(output_path, 'w', encoding='utf-8', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(results)
-
+        writer.close()
     except Exception as e:
         print(f"Error: Could not write to output file '{args.output}': {e}", file=sys.stderr)
         sys.exit(1)
 
     # Print confirmation to stdout
-    print(f"Successfully processed {len(results)} inscription(s) -> '{args.output}'")
+    print(f"Successfully processed {writer.count} inscription(s) -> '{args.output}'")
 
 
 if __name__ == "__main__":
@@ -5,8 +5,89 @@ This module uses dependency parsing to understand grammatical relationships
 between words, revealing WHO did WHAT to WHOM even in complex inscriptions.
 """
 
+import hashlib
+import json
+import os
 import re
-from typing import Dict, Any, List, Tuple, Optional
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, NamedTuple, Tuple, Optional
+
+
+# Text normalization patterns
+_BR_RE = re.compile(r'<BR/?>')
+_WS_RE = re.compile(r'\s+')
+
+# Any letter; texts without one (e.g. only sigla or lacunae) are not parsed
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Verbs that mark the dedicator as their subject, in order of precedence
+_DEDICATION_VERBS = (
+    'FECIT', 'FECERUNT', 'POSUIT', 'POSUERUNT', 'CURAVIT', 'CURAVERUNT'
+)
+
+# Verbs that mark an inscription as a dedication in structural analysis
+_MAIN_VERBS = ('FECIT', 'FECERUNT', 'POSUIT', 'POSUERUNT')
+
+# Every keyword the text-level checks look for, scanned in one pass:
+# dedication verbs as substrings and ET (and) as a space-delimited word
+_KEYWORD_RE = re.compile(
+    '|'.join(sorted(_DEDICATION_VERBS)) + r'|(?<= )ET(?= )'
+)
+
+
+def _scan_keywords(text_upper: str) -> Dict[str, int]:
+    """Map each keyword found in the uppercased text to its first position."""
+    found = {}
+    for match in _KEYWORD_RE.finditer(text_upper):
+        found.setdefault(match.group(0), match.start())
+    return found
+
+
+def _first_keyword(found: Dict[str, int], candidates: Tuple[str, ...]) -> Optional[str]:
+    """Return the first of candidates, in their order, that is in found."""
+    return next((keyword for keyword in candidates if keyword in found), None)
+
+
+# Relationship lemmas recognized as indirect objects
+_RELATIONSHIP_LEMMAS = {
+    'pater': 'father',
+    'mater': 'mother',
+    'filius': 'son',
+    'filia': 'daughter',
+    'coniunx': 'spouse',
+    'uxor': 'wife',
+}
+
+
+class _WordColumns(NamedTuple):
+    """Parallel per-word attribute lists read once from CLTK words."""
+    strings: List[Optional[str]]
+    lemmas: List[Optional[str]]
+    pos: List[Optional[str]]
+    deps: List[Optional[str]]
+    cases: List[Optional[str]]
+    has_governor: List[bool]
+
+
+def _to_columns(words: List[Any]) -> _WordColumns:
+    """
+    Read the attributes used by the dependency rules from each word once.
+
+    Missing attributes become None, so the rules can test values directly
+    instead of probing each word with hasattr.
+    """
+    strings, lemmas, pos, deps, cases, has_governor = [], [], [], [], [], []
+    for word in words:
+        strings.append(getattr(word, 'string', None))
+        lemmas.append(getattr(word, 'lemma', None))
+        pos.append(getattr(word, 'pos', None))
+        deps.append(getattr(word, 'dependency_relation', None))
+        features = getattr(word, 'features', None)
+        cases.append(features.get('Case') if features else None)
+        has_governor.append(hasattr(word, 'governor'))
+    return _WordColumns(strings, lemmas, pos, deps, cases, has_governor)
 
 
 class LatinDependencyParser:
@@ -20,27 +101,77 @@ class LatinDependencyParser:
     - Nested structures (multiple people, complex dedications)
     """
 
-    def __init__(self):
-        """Initialize the dependency parser."""
+    def __init__(self, cache_size: int = 4096, cache_dir: Optional[str] = None):
+        """
+        Initialize the dependency parser.
+
+        Args:
+            cache_size: Number of normalized texts whose extracted entities
+                are kept in an LRU cache (0 disables caching)
+            cache_dir: Directory for a persistent cache of extracted entities,
+                shared across runs (None disables it)
+        """
         self._nlp = None
         self._initialized = False
+        self._init_lock = threading.Lock()
+        self._warm_up_thread = None
+        self._cache_size = cache_size
+        self._entity_cache = OrderedDict()
+        self._last_parse = None
+        self.cache_dir = Path(cache_dir) if cache_dir else None
 
     def _ensure_initialized(self):
         """Lazy initialization of CLTK to avoid startup overhead."""
         if self._initialized:
             return
 
-        try:
-            from cltk import NLP
-            self._nlp = NLP(language="lat", suppress_banner=True)
-            self._initialized = True
-        except ImportError:
-            raise ImportError(
-                "CLTK is required for dependency parsing. "
-                "Install with: pip install cltk"
+        # Threads warming up the pipeline must not load the models twice
+        with self._init_lock:
+            if self._initialized:
+                return
+            try:
+                from cltk import NLP
+                self._nlp = NLP(language="lat", suppress_banner=True)
+                self._initialized = True
+            except ImportError:
+                raise ImportError(
+                    "CLTK is required for dependency parsing. "
+                    "Install with: pip install cltk"
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to initialize CLTK: {e}")
+
+    def warm_up(self):
+        """
+        Start loading the CLTK pipeline in a background thread.
+
+        Only one warm-up thread is started per instance. Errors are left
+        for the first real call to report.
+        """
+        with self._init_lock:
+            if self._initialized or self._warm_up_thread is not None:
+                return
+            self._warm_up_thread = threading.Thread(
+                target=self._warm_up, daemon=True
             )
-        except Exception as e:
-            raise RuntimeError(f"Failed to initialize CLTK: {e}")
+            self._warm_up_thread.start()
+
+    def _warm_up(self):
+        """Initialize CLTK, ignoring failures."""
+        try:
+            self._ensure_initialized()
+        except (ImportError, RuntimeError):
+            pass
+
+    def wait_for_warm_up(self):
+        """Block until a warm-up started by warm_up has finished."""
+        thread = self._warm_up_thread
+        if thread is not None:
+            thread.join()
+
+    def _normalize(self, text: str) -> str:
+        """Normalize line breaks and whitespace before parsing."""
+        return _WS_RE.sub(' ', _BR_RE.sub(' ', text)).strip()
 
     def parse_dependencies(self, text: str) -> Dict[str, Any]:
         """
@@ -52,19 +183,35 @@ class LatinDependencyParser:
         Returns:
             Dictionary containing dependency parse tree and analysis
         """
+        normalized_text = self._normalize(text)
+        if not _LETTER_RE.search(normalized_text):
+            return {'doc': None, 'words': [], 'sentences': []}
+
         self._ensure_initialized()
+        return self._parse_normalized(normalized_text)
+
+    def _parse_normalized(self, normalized_text: str) -> Dict[str, Any]:
+        """
+        Run the CLTK pipeline on already-normalized text.
 
-        # Normalize text
-        normalized_text = text.replace('<BR>', ' ').replace('<BR/>', ' ')
-        normalized_text = re.sub(r'\s+', ' ', normalized_text.strip())
+        The most recent successful parse is kept, so the tree, structure and
+        entity views of one inscription (as in extraction reports) share it,
+        unless caching is disabled.
+        """
+        last_parse = self._last_parse
+        if last_parse is not None and last_parse[0] == normalized_text:
+            return last_parse[1]
 
         try:
             doc = self._nlp.analyze(text=normalized_text)
-            return {
+            parse_result = {
                 'doc': doc,
                 'words': doc.words if hasattr(doc, 'words') else [],
                 'sentences': doc.sentences if hasattr(doc, 'sentences') else [],
             }
+            if self._cache_size > 0:
+                self._last_parse = (normalized_text, parse_result)
+            return parse_result
         except Exception as e:
             return {
                 'error': str(e),
@@ -73,7 +220,11 @@ class LatinDependencyParser:
                 'sentences': []
             }
 
-    def extract_entities_by_dependencies(self, text: str) -> Dict[str, Dict[str, Any]]:
+    def extract_entities_by_dependencies(
+        self,
+        text: str,
+        cache_dir: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Extract entities using dependency parsing.
 
@@ -84,79 +235,193 @@ class LatinDependencyParser:
         - Genitive modifiers (possessors/deceased)
         - Nested relationships
 
+        Results are cached by normalized text, so repeated formulae are
+        only parsed once.
+
         Args:
             text: The inscription text to analyze
+            cache_dir: Directory for the persistent entity cache (default:
+                the one given to the constructor)
 
         Returns:
             Dictionary of extracted entities with confidence scores
         """
-        entities = {}
-        parse_result = self.parse_dependencies(text)
+        return self.extract_entities_by_dependencies_batch([text], cache_dir)[0]
 
-        if 'error' in parse_result or not parse_result['words']:
-            return entities
+    def extract_entities_by_dependencies_batch(
+        self,
+        texts: List[str],
+        cache_dir: Optional[str] = None
+    ) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Extract entities for a batch of texts using dependency parsing.
 
-        doc = parse_result['doc']
-        words = parse_result['words']
+        Only texts missing from the cache are sent through CLTK. Failed
+        parses are not cached, so they are retried on the next call.
+
+        Args:
+            texts: The inscription texts to analyze
+            cache_dir: Directory for the persistent entity cache (default:
+                the one given to the constructor)
 
-        # Extract using dependency rules
-        entities.update(self._extract_verb_subjects(words, text))
-        entities.update(self._extract_verb_objects(words))
-        entities.update(self._extract_genitive_modifiers(words))
-        entities.update(self._extract_nested_relationships(words, text))
+        Returns:
+            List of entity dictionaries, in the same order as texts
+        """
+        disk_dir = Path(cache_dir) if cache_dir else self.cache_dir
+        normalized = [self._normalize(text) for text in texts]
 
+        # Parse each distinct uncached text once
+        found = {}
+        for normalized_text in normalized:
+            if normalized_text in found:
+                continue
+            if not _LETTER_RE.search(normalized_text):
+                # Nothing to parse, so skip CLTK and the caches entirely
+                found[normalized_text] = {}
+                continue
+            entities = self._cache_get(normalized_text)
+            if entities is None:
+                entities = self._disk_cache_get(disk_dir, normalized_text)
+                if entities is not None:
+                    self._cache_put(normalized_text, entities)
+                else:
+                    self._ensure_initialized()
+                    parse_result = self._parse_normalized(normalized_text)
+                    entities = self._entities_from_parse(parse_result, normalized_text)
+                    if 'error' not in parse_result:
+                        self._disk_cache_put(disk_dir, normalized_text, entities)
+                        self._cache_put(normalized_text, entities)
+            found[normalized_text] = entities
+
+        # Callers annotate entity dicts in place, so hand out copies
+        return [
+            {key: dict(value) for key, value in found[normalized_text].items()}
+            for normalized_text in normalized
+        ]
+
+    def _cache_get(self, normalized_text: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Look up cached entities, marking the entry as recently used."""
+        entities = self._entity_cache.get(normalized_text)
+        if entities is not None:
+            self._entity_cache.move_to_end(normalized_text)
         return entities
 
-    def _extract_verb_subjects(
+    def _cache_put(self, normalized_text: str, entities: Dict[str, Dict[str, Any]]):
+        """Store entities, evicting the least recently used entry when full."""
+        if self._cache_size <= 0:
+            return
+        self._entity_cache[normalized_text] = entities
+        self._entity_cache.move_to_end(normalized_text)
+        while len(self._entity_cache) > self._cache_size:
+            self._entity_cache.popitem(last=False)
+
+    def _disk_cache_path(self, cache_dir: Path, normalized_text: str) -> Path:
+        """Path of the persistent cache entry for a normalized text."""
+        key = hashlib.blake2b(normalized_text.encode('utf-8'), digest_size=16).hexdigest()
+        return cache_dir / key[:2] / f"{key}.json"
+
+    def _disk_cache_get(
         self,
-        words: List[Any],
+        cache_dir: Optional[Path],
+        normalized_text: str
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Read entities from the persistent cache, if enabled and present."""
+        if cache_dir is None:
+            return None
+        try:
+            with open(self._disk_cache_path(cache_dir, normalized_text), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _disk_cache_put(
+        self,
+        cache_dir: Optional[Path],
+        normalized_text: str,
+        entities: Dict[str, Dict[str, Any]]
+    ):
+        """Write entities to the persistent cache, if enabled."""
+        if cache_dir is None:
+            return
+        path = self._disk_cache_path(cache_dir, normalized_text)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see partial entries
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entities, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The cache is an optimization; a failed write only costs a re-parse
+            pass
+
+    def _entities_from_parse(
+        self,
+        parse_result: Dict[str, Any],
         text: str
     ) -> Dict[str, Dict[str, Any]]:
-        """
-        Extract subjects of main verbs using dependency relations.
-
-        Looks for:
-        - FECIT/POSUIT with nsubj (nominal subject)
-        - Subject is typically the dedicator
-        """
+        """Apply the dependency extraction rules to a parse result."""
         entities = {}
 
-        # Find dedication verbs in text
-        dedication_verbs = ['FECIT', 'FECERUNT', 'POSUIT', 'POSUERUNT',
-                           'CURAVIT', 'CURAVERUNT']
-        text_upper = text.upper()
-        main_verb_found = None
-        for verb in dedication_verbs:
-            if verb in text_upper:
-                main_verb_found = verb
-                break
-
-        if not main_verb_found:
+        if 'error' in parse_result or not parse_result['words']:
             return entities
 
-        # Find the verb word and its subjects using dependencies
+        columns = _to_columns(parse_result['words'])
+        keywords = _scan_keywords(text.upper())
+
+        # Find dedication verbs in text; subjects only count when one is present
+        main_verb_found = _first_keyword(keywords, _DEDICATION_VERBS)
+        # Look for coordination (ET = and)
+        has_coordination = 'ET' in keywords
+
+        # Apply every dependency rule in a single pass over the words:
+        # - verb subjects (nsubj) -> dedicator
+        # - indirect objects (iobj/obl) with relationship lemmas -> relationship
+        # - genitive nominal modifiers (nmod) -> deceased
+        # - conjuncts (conj) -> coordinated dedicators
         subjects = []
         verb_index = -1
+        relationship = None
+        genitive_chains = []
+        coordinated_subjects = []
 
-        for i, word in enumerate(words):
-            # Find the main verb
-            if (hasattr(word, 'string') and
-                word.string.upper() in dedication_verbs):
-                verb_index = i
+        for i, dep_rel in enumerate(columns.deps):
+            string = columns.strings[i]
 
-            # Look for words with nsubj (nominal subject) dependency
-            if hasattr(word, 'dependency_relation'):
-                dep_rel = word.dependency_relation
-                if dep_rel in ['nsubj', 'nsubj:pass']:
+            if main_verb_found:
+                # Find the main verb
+                if string is not None and string.upper() in _DEDICATION_VERBS:
+                    verb_index = i
+
+                # Look for words with nsubj (nominal subject) dependency
+                if dep_rel in ('nsubj', 'nsubj:pass'):
                     # Check if this is subject of our verb
-                    if hasattr(word, 'governor'):
+                    if columns.has_governor[i]:
                         # In some parsers, governor points to head
-                        subjects.append(word.string)
+                        subjects.append(string)
                     else:
                         # Fallback: assume subjects come before verb
                         if i < verb_index or verb_index == -1:
-                            if hasattr(word, 'pos') and word.pos in ['PROPN', 'NOUN']:
-                                subjects.append(word.string)
+                            if columns.pos[i] in ('PROPN', 'NOUN'):
+                                subjects.append(string)
+
+            # Indirect object (dative) - recipient of dedication
+            if dep_rel in ('iobj', 'obl'):
+                if columns.lemmas[i] is not None:
+                    lemma = columns.lemmas[i].lower()
+                    # Check if it's a relationship word
+                    if lemma in _RELATIONSHIP_LEMMAS:
+                        relationship = _RELATIONSHIP_LEMMAS[lemma]
+
+            # Nominal modifier (often genitive)
+            elif dep_rel in ('nmod', 'nmod:poss'):
+                if columns.cases[i] == 'Gen' and string is not None:
+                    genitive_chains.append(string)
+
+            # Look for conj (conjunction) relation
+            elif dep_rel == 'conj' and has_coordination:
+                if columns.pos[i] in ('PROPN', 'NOUN') and string is not None:
+                    coordinated_subjects.append(string)
 
         if subjects:
             dedicator_name = ' '.join(subjects)
@@ -167,76 +432,13 @@ class LatinDependencyParser:
                 'relation': 'subject_of_' + main_verb_found.lower()
             }
 
-        return entities
-
-    def _extract_verb_objects(self, words: List[Any]) -> Dict[str, Dict[str, Any]]:
-        """
-        Extract objects of verbs using dependency relations.
-
-        Looks for:
-        - obj (direct object)
-        - iobj (indirect object) - typically dative relationships
-        """
-        entities = {}
-
-        indirect_objects = []
-
-        for word in words:
-            if not hasattr(word, 'dependency_relation'):
-                continue
-
-            dep_rel = word.dependency_relation
-
-            # Indirect object (dative) - recipient of dedication
-            if dep_rel in ['iobj', 'obl']:
-                if hasattr(word, 'lemma'):
-                    lemma = word.lemma.lower()
-                    # Check if it's a relationship word
-                    relationship_map = {
-                        'pater': 'father',
-                        'mater': 'mother',
-                        'filius': 'son',
-                        'filia': 'daughter',
-                        'coniunx': 'spouse',
-                        'uxor': 'wife',
-                    }
-                    if lemma in relationship_map:
-                        entities['relationship_dependency'] = {
-                            'value': relationship_map[lemma],
-                            'confidence': 0.90,
-                            'source': 'dependency',
-                            'relation': 'indirect_object'
-                        }
-
-                # Also store the word itself
-                if hasattr(word, 'string'):
-                    indirect_objects.append(word.string)
-
-        return entities
-
-    def _extract_genitive_modifiers(self, words: List[Any]) -> Dict[str, Dict[str, Any]]:
-        """
-        Extract genitive modifiers using dependency relations.
-
-        Looks for:
-        - nmod (nominal modifier) with genitive case
-        - Indicates possession or relationship
-        """
-        entities = {}
-        genitive_chains = []
-
-        for word in words:
-            if not hasattr(word, 'dependency_relation'):
-                continue
-
-            dep_rel = word.dependency_relation
-
-            # Nominal modifier (often genitive)
-            if dep_rel in ['nmod', 'nmod:poss']:
-                if hasattr(word, 'features') and word.features:
-                    if word.features.get('Case') == 'Gen':
-                        if hasattr(word, 'string'):
-                            genitive_chains.append(word.string)
+        if relationship:
+            entities['relationship_dependency'] = {
+                'value': relationship,
+                'confidence': 0.90,
+                'source': 'dependency',
+                'relation': 'indirect_object'
+            }
 
         if genitive_chains:
             # Genitive modifiers typically refer to the deceased
@@ -248,42 +450,13 @@ class LatinDependencyParser:
                 'relation': 'genitive_modifier'
             }
 
-        return entities
-
-    def _extract_nested_relationships(
-        self,
-        words: List[Any],
-        text: str
-    ) -> Dict[str, Dict[str, Any]]:
-        """
-        Extract nested relationships from complex inscriptions.
-
-        Handles patterns like:
-        - Multiple dedicators (ET pattern)
-        - Multiple relationships
-        - Nested genitive chains
-        """
-        entities = {}
-
-        # Look for coordination (ET = and)
-        text_upper = text.upper()
-        if ' ET ' in text_upper:
+        if has_coordination:
             entities['has_coordination'] = {
                 'value': 'true',
                 'confidence': 0.95,
                 'source': 'dependency'
             }
 
-            # Find coordinated subjects
-            coordinated_subjects = []
-            for word in words:
-                if hasattr(word, 'dependency_relation'):
-                    # Look for conj (conjunction) relation
-                    if word.dependency_relation == 'conj':
-                        if hasattr(word, 'pos') and word.pos in ['PROPN', 'NOUN']:
-                            if hasattr(word, 'string'):
-                                coordinated_subjects.append(word.string)
-
             if coordinated_subjects:
                 entities['coordinated_dedicators'] = {
                     'value': ', '.join(coordinated_subjects),
@@ -345,7 +518,7 @@ class LatinDependencyParser:
             return {'error': parse_result['error']}
 
         words = parse_result['words']
-        text_upper = text.upper()
+        keywords = _scan_keywords(text.upper())
 
         analysis = {
             'word_count': len(words),
@@ -354,30 +527,27 @@ class LatinDependencyParser:
             'subject_count': 0,
             'has_genitive': False,
             'has_dative': False,
-            'has_coordination': ' ET ' in text_upper,
+            'has_coordination': 'ET' in keywords,
             'complexity': 'simple'
         }
 
         # Find main verb
-        dedication_verbs = ['FECIT', 'FECERUNT', 'POSUIT', 'POSUERUNT']
-        for verb in dedication_verbs:
-            if verb in text_upper:
-                analysis['has_main_verb'] = True
-                analysis['main_verb'] = verb
-                break
+        main_verb = _first_keyword(keywords, _MAIN_VERBS)
+        if main_verb:
+            analysis['has_main_verb'] = True
+            analysis['main_verb'] = main_verb
 
         # Count subjects, genitives, datives
-        for word in words:
-            if hasattr(word, 'dependency_relation'):
-                if word.dependency_relation in ['nsubj', 'nsubj:pass']:
-                    analysis['subject_count'] += 1
+        columns = _to_columns(words)
+        for i, dep_rel in enumerate(columns.deps):
+            if dep_rel in ('nsubj', 'nsubj:pass'):
+                analysis['subject_count'] += 1
 
-            if hasattr(word, 'features') and word.features:
-                case = word.features.get('Case')
-                if case == 'Gen':
-                    analysis['has_genitive'] = True
-                if case == 'Dat':
-                    analysis['has_dative'] = True
+            case = columns.cases[i]
+            if case == 'Gen':
+                analysis['has_genitive'] = True
+            if case == 'Dat':
+                analysis['has_dative'] = True
 
         # Determine complexity
         complexity_score = 0
@@ -404,13 +574,19 @@ class LatinDependencyParser:
         return analysis
 
 
+# Shared instance returned by get_dependency_parser
+_DEPENDENCY_PARSER: Optional[LatinDependencyParser] = None
+
+
 def get_dependency_parser() -> LatinDependencyParser:
     """
     Get a singleton instance of the dependency parser.
 
-    This avoids reloading CLTK models multiple times.
+    This avoids reloading CLTK models multiple times. The shared instance
+    has no persistent cache; callers pass cache_dir to the extraction
+    methods instead.
     """
     global _DEPENDENCY_PARSER
-    if '_DEPENDENCY_PARSER' not in globals():
+    if _DEPENDENCY_PARSER is None:
         _DEPENDENCY_PARSER = LatinDependencyParser()
     return _DEPENDENCY_PARSER
@@ -5,29 +5,241 @@ The Epigraphic Database Heidelberg (EDH) provides a public API for accessing
 inscription data. This module provides utilities for downloading and saving
 inscription metadata.
 """
+import atexit
+import hashlib
 import json
+import math
 import os
-import re
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+# orjson is optional; the standard library json module is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # EDH API base URL
 EDH_API_BASE = "https://edh-www.adw.uni-heidelberg.de/data/api"
 
+# Items requested per search page, and the EDH default used if a larger
+# limit is rejected
+SEARCH_PAGE_SIZE = 100
+SEARCH_FALLBACK_PAGE_SIZE = 20
+
+# Seconds a cached API response stays valid
+RESPONSE_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+def _build_session() -> requests.Session:
+    """
+    Build the HTTP session shared by all EDH API calls.
+
+    Reusing one session keeps connections alive between requests, so repeated
+    calls to the EDH hosts do not pay for a new TCP and TLS handshake each time.
+    Transient server errors are retried with a short backoff. Once retries
+    run out the last response is returned, so raise_for_status() still
+    reports the HTTP error.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared HTTP session (connection pooling and keep-alive)
+_SESSION = _build_session()
+
+# Thread pool for writing search results, created on first use and reused
+# by later searches
+_WRITE_POOL: Optional[ThreadPoolExecutor] = None
+_WRITE_POOL_SIZE = 0
+_WRITE_POOL_LOCK = threading.Lock()
+
+
+def _get_write_pool(workers: int) -> ThreadPoolExecutor:
+    """Return the shared writer pool, resizing it if a different size is requested."""
+    global _WRITE_POOL, _WRITE_POOL_SIZE
+    with _WRITE_POOL_LOCK:
+        if _WRITE_POOL is None or _WRITE_POOL_SIZE != workers:
+            if _WRITE_POOL is not None:
+                # Queued writes still finish; idle threads exit
+                _WRITE_POOL.shutdown(wait=False)
+            _WRITE_POOL = ThreadPoolExecutor(max_workers=workers,
+                                             thread_name_prefix='edh-write')
+            _WRITE_POOL_SIZE = workers
+        return _WRITE_POOL
+
+
+@atexit.register
+def _shutdown_write_pool():
+    """Wait for pending writes before the interpreter exits."""
+    with _WRITE_POOL_LOCK:
+        if _WRITE_POOL is not None:
+            _WRITE_POOL.shutdown(wait=True)
+
+
+def _orjson_matches_json(data: Any) -> bool:
+    """
+    Check that orjson would encode data exactly as json.dumps does.
+
+    That holds for nested dicts with str keys and lists of str, bool, None,
+    64-bit int or plainly formatted float values. orjson writes floats in
+    exponent form differently (1e-7, not 1e-07) and writes NaN and infinity
+    as null.
+    """
+    kind = type(data)
+    if kind is dict:
+        return all(
+            type(key) is str and _orjson_matches_json(value)
+            for key, value in data.items()
+        )
+    if kind is list:
+        return all(_orjson_matches_json(value) for value in data)
+    if kind is float:
+        # Also False for NaN and infinity
+        return data == 0.0 or 1e-4 <= abs(data) < 1e16
+    if kind is int:
+        return -2 ** 63 <= data < 2 ** 64
+    return kind is str or kind is bool or data is None
+
+
+def _encode_json(data: Any, compact: bool = False) -> bytes:
+    """
+    Encode data as UTF-8 JSON, indented unless compact is True.
+
+    Produces the same text as json.dump(data, f, indent=2, ensure_ascii=False),
+    or with separators=(',', ':') and no indent when compact. orjson is used
+    when it is available and would encode the data identically; otherwise
+    the standard library.
+    """
+    if orjson is not None and _orjson_matches_json(data):
+        try:
+            return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. strings with lone surrogates; let json handle them
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_atomic(path: Path, payload: bytes):
+    """
+    Write bytes to path so readers never see a partial file.
+
+    The payload goes to a temporary file in the same directory, which then
+    replaces the target in one step. A crash mid-write leaves the previous
+    file (or none) rather than truncated JSON.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _response_cache_path(cache_dir: str, url: str, params: Optional[Dict[str, Any]] = None) -> Path:
+    """Path of the cache entry for a GET request (URL plus query parameters)."""
+    request_key = url + '?' + json.dumps(params or {}, sort_keys=True)
+    key = hashlib.blake2b(request_key.encode('utf-8'), digest_size=16).hexdigest()
+    return Path(cache_dir) / key[:2] / f"{key}.json"
+
+
+def _response_cache_get(
+    cache_dir: Optional[str],
+    url: str,
+    params: Optional[Dict[str, Any]] = None
+) -> Optional[Any]:
+    """Return a cached API response if caching is enabled and the entry is fresh."""
+    if cache_dir is None:
+        return None
+    path = _response_cache_path(cache_dir, url, params)
+    try:
+        if time.time() - path.stat().st_mtime > RESPONSE_CACHE_MAX_AGE:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _response_cache_put(
+    cache_dir: Optional[str],
+    data: Any,
+    url: str,
+    params: Optional[Dict[str, Any]] = None
+):
+    """Store an API response in the cache, if enabled."""
+    if cache_dir is None:
+        return
+    path = _response_cache_path(cache_dir, url, params)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, _encode_json(data, compact=True))
+    except OSError:
+        # The cache is an optimization; a failed write only costs a refetch
+        pass
+
 
-def download_edh_inscription(inscription_id: str, out_dir: str) -> str:
+def _normalize_bbox(bbox: str) -> str:
+    """
+    Validate a "minLong,minLat,maxLong,maxLat" bounding box.
+
+    Each coordinate may be any finite number (surrounding spaces and
+    exponents are accepted). Returns the box with spaces removed.
+
+    Raises:
+        ValueError: If the box does not have four numeric coordinates
+    """
+    parts = [part.strip() for part in bbox.split(',')]
+    try:
+        valid = len(parts) == 4 and all(math.isfinite(float(part)) for part in parts)
+    except ValueError:
+        valid = False
+    if not valid:
+        raise ValueError("Invalid bbox format. Expected: minLong,minLat,maxLong,maxLat")
+    return ','.join(parts)
+
+
+def download_edh_inscription(
+    inscription_id: str,
+    out_dir: str,
+    compact: bool = False,
+    cache_dir: Optional[str] = None
+) -> str:
     """
     Download an inscription from the EDH API and save it as JSON.
 
     Args:
         inscription_id: The EDH inscription ID (e.g., "HD000001")
         out_dir: Directory to save the downloaded JSON file
+        compact: Write JSON without indentation (default: False)
+        cache_dir: Directory for cached API responses (default: no caching)
 
     Returns:
         Path to the saved JSON file
@@ -64,12 +276,14 @@ def download_edh_inscription(inscription_id: str, out_dir: str) -> str:
 
     # Download inscription data
     try:
-        print(f"Downloading inscription {inscription_id} from EDH API...", file=sys.stderr)
-        response = requests.get(api_url, timeout=30)
-        response.raise_for_status()  # Raise HTTPError for bad responses (4xx, 5xx)
+        data = _response_cache_get(cache_dir, api_url)
+        if data is None:
+            print(f"Downloading inscription {inscription_id} from EDH API...", file=sys.stderr)
+            response = _SESSION.get(api_url, timeout=30)
+            response.raise_for_status()  # Raise HTTPError for bad responses (4xx, 5xx)
 
-        # Parse JSON response
-        data = response.json()
+            # Parse JSON response
+            data = response.json()
 
         # Check if the response indicates the inscription was not found
         # EDH API may return 200 with an error message in some cases
@@ -80,6 +294,8 @@ def download_edh_inscription(inscription_id: str, out_dir: str) -> str:
             # Empty or no inscriptions found
             raise ValueError(f"No inscription found with ID {inscription_id}")
 
+        _response_cache_put(cache_dir, data, api_url)
+
     except requests.exceptions.Timeout:
         raise requests.HTTPError(f"Request timed out while fetching {inscription_id} from EDH API")
     except requests.exceptions.ConnectionError as e:
@@ -92,8 +308,7 @@ def download_edh_inscription(inscription_id: str, out_dir: str) -> str:
     # Save to file
     output_file = out_path / f"{inscription_id}.json"
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _write_atomic(output_file, _encode_json(data, compact))
 
         print(f"Saved inscription to {output_file}", file=sys.stderr)
         return str(output_file)
@@ -113,7 +328,9 @@ def search_edh_inscriptions(
     year_to: Optional[int] = None,
     max_results: int = 100,
     workers: int = 10,
-    resume: bool = True
+    resume: bool = True,
+    compact: bool = False,
+    cache_dir: Optional[str] = None
 ) -> List[str]:
     """
     Search EDH API and download matching inscriptions.
@@ -128,8 +345,10 @@ def search_edh_inscriptions(
         year_from: Year not before (negative for BC)
         year_to: Year not after
         max_results: Maximum inscriptions to download (default: 100)
-        workers: Parallel download workers (default: 10, max: 50)
+        workers: Parallel file-writing workers (default: 10, max: 50)
         resume: Skip already-downloaded files (default: True)
+        compact: Write JSON without indentation (default: False)
+        cache_dir: Directory for cached API responses (default: no caching)
 
     Returns:
         List of paths to downloaded JSON files
@@ -151,9 +370,7 @@ def search_edh_inscriptions(
         search_params['fo_antik'] = fo_antik
     if bbox:
         # Validate bbox format: minLong,minLat,maxLong,maxLat
-        if not re.match(r'^-?\d+\.?\d*,-?\d+\.?\d*,-?\d+\.?\d*,-?\d+\.?\d*$', bbox):
-            raise ValueError("Invalid bbox format. Expected: minLong,minLat,maxLong,maxLat")
-        search_params['bbox'] = bbox
+        search_params['bbox'] = _normalize_bbox(bbox)
     if year_from is not None:
         search_params['dat_jahr_a'] = year_from
     if year_to is not None:
@@ -169,22 +386,69 @@ def search_edh_inscriptions(
     except OSError as e:
         raise OSError(f"Could not create output directory '{out_dir}': {e}")
 
+    def save_inscription(inscription_data):
+        """Save a single inscription to JSON file."""
+        # Extract ID from inscription data
+        insc_id = inscription_data.get('inscription_id') or inscription_data.get('id')
+
+        if not insc_id:
+            # Generate ID from hd_nr if available
+            hd_nr = inscription_data.get('hd_nr')
+            if hd_nr:
+                insc_id = f"HD{str(hd_nr).zfill(6)}"
+            else:
+                return None  # Can't save without ID
+
+        output_file = out_path / f"{insc_id}.json"
+
+        # Skip if resume enabled and file exists
+        if resume and output_file.exists():
+            return str(output_file)
+
+        try:
+            _write_atomic(output_file, _encode_json(inscription_data, compact))
+            return str(output_file)
+        except (OSError, ValueError) as e:
+            # ValueError: text that cannot be encoded, e.g. a lone surrogate
+            print(f"Warning: Failed to save {insc_id}: {e}", file=sys.stderr)
+            return None
+
     # Phase 2: Paginated search
+    # Search results are already full inscription records, so no per-item
+    # download is needed. Each page is handed to the writer pool as soon as it
+    # arrives, so files are written while the next page is being fetched.
     SEARCH_URL = "https://edh.ub.uni-heidelberg.de/data/api/inschrift/suche"
     offset = 0
-    page_size = 20  # EDH API default/max
-    all_items = []
+    # Ask for large pages to cut round-trips; fall back to the documented
+    # 20-item page if the server rejects the larger limit
+    page_size = max(1, min(max_results, SEARCH_PAGE_SIZE))
+    workers_count = min(workers, 50)  # Cap at 50 workers
+    futures = []
 
     print(f"Searching EDH API with parameters: {search_params}", file=sys.stderr)
 
-    while len(all_items) < max_results:
+    executor = _get_write_pool(workers_count)
+
+    def queue_page(items):
+        """Submit a page of items for saving, up to the user's limit."""
+        for item in items[:max_results - len(futures)]:
+            futures.append(executor.submit(save_inscription, item))
+
+    while len(futures) < max_results:
         # Add pagination params
         params = {**search_params, 'offset': offset, 'limit': page_size}
 
         try:
-            response = requests.get(SEARCH_URL, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = _response_cache_get(cache_dir, SEARCH_URL, params)
+            fetched = data is None
+            if fetched:
+                response = _SESSION.get(SEARCH_URL, params=params, timeout=30)
+                if (response.status_code in (400, 422)
+                        and page_size > SEARCH_FALLBACK_PAGE_SIZE):
+                    page_size = SEARCH_FALLBACK_PAGE_SIZE
+                    continue
+                response.raise_for_status()
+                data = response.json()
 
             total = data.get('total', 0)
             items = data.get('items', [])
@@ -192,100 +456,53 @@ def search_edh_inscriptions(
             if not items:
                 break  # No more results
 
-            all_items.extend(items)
-            offset += page_size
+            # Only pages with a list of items are cached, so an error or
+            # malformed payload is not replayed by later runs
+            if fetched and isinstance(items, list):
+                _response_cache_put(cache_dir, data, SEARCH_URL, params)
 
-            print(f"Retrieved {len(all_items)}/{min(total, max_results)} inscriptions...",
-                  file=sys.stderr)
+            queue_page(items)
+            # Advance by what was returned, in case the server caps the limit
+            offset += len(items)
 
-            # Don't exceed user's limit
-            if len(all_items) >= max_results:
-                all_items = all_items[:max_results]
-                break
+            print(f"Retrieved {len(futures)}/{min(total, max_results)} inscriptions...",
+                  file=sys.stderr)
 
             # Don't exceed available results
-            if len(all_items) >= total:
+            if len(futures) >= total:
                 break
 
-            # Small delay between pagination requests
-            time.sleep(0.1)
-
         except requests.exceptions.RequestException as e:
             print(f"Warning: Search request failed: {e}", file=sys.stderr)
             time.sleep(1)
             # Retry once
             try:
-                response = requests.get(SEARCH_URL, params=params, timeout=30)
+                response = _SESSION.get(SEARCH_URL, params=params, timeout=30)
                 response.raise_for_status()
                 data = response.json()
                 items = data.get('items', [])
-                all_items.extend(items)
-                offset += page_size
+                queue_page(items)
+                offset += len(items) or page_size
             except:
                 break  # Give up on this page
 
-    print(f"Search complete. Found {len(all_items)} inscriptions.", file=sys.stderr)
+    print(f"Search complete. Found {len(futures)} inscriptions.", file=sys.stderr)
 
-    if not all_items:
+    if not futures:
         print("No inscriptions found matching search criteria.", file=sys.stderr)
         return []
 
-    # Phase 3: Parallel download
-    def save_inscription(inscription_data):
-        """Save a single inscription to JSON file."""
-        # Extract ID from inscription data
-        insc_id = inscription_data.get('inscription_id') or inscription_data.get('id')
-
-        if not insc_id:
-            # Generate ID from hd_nr if available
-            hd_nr = inscription_data.get('hd_nr')
-            if hd_nr:
-                insc_id = f"HD{str(hd_nr).zfill(6)}"
-            else:
-                return None  # Can't save without ID
-
-        output_file = out_path / f"{insc_id}.json"
-
-        # Skip if resume enabled and file exists
-        if resume and output_file.exists():
-            return str(output_file)
-
-        try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(inscription_data, f, indent=2, ensure_ascii=False)
-            return str(output_file)
-        except Exception as e:
-            print(f"Warning: Failed to save {insc_id}: {e}", file=sys.stderr)
-            time.sleep(1)
-            # Retry once
-            try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(inscription_data, f, indent=2, ensure_ascii=False)
-                return str(output_file)
-            except:
-                return None
-
-    # Parallel download with progress tracking
+    # Phase 3: Collect saved files with progress tracking
     saved_files = []
-    workers_count = min(workers, 50)  # Cap at 50 workers
-
-    print(f"Downloading {len(all_items)} inscriptions with {workers_count} workers...",
-          file=sys.stderr)
-
-    with ThreadPoolExecutor(max_workers=workers_count) as executor:
-        # Submit all download tasks
-        futures = {executor.submit(save_inscription, item): item
-                   for item in all_items}
 
-        # Process completed downloads
-        for i, future in enumerate(as_completed(futures), 1):
-            result = future.result()
-            if result:
-                saved_files.append(result)
+    for i, future in enumerate(futures, 1):
+        result = future.result()
+        if result:
+            saved_files.append(result)
 
-            # Progress update every 10 items or at end
-            if i % 10 == 0 or i == len(all_items):
-                print(f"Saved {i}/{len(all_items)} inscriptions", file=sys.stderr)
+        # Progress update every 10 items or at end
+        if i % 10 == 0 or i == len(futures):
+            print(f"Saved {i}/{len(futures)} inscriptions", file=sys.stderr)
 
     print(f"Download complete. Saved {len(saved_files)} files to {out_dir}", file=sys.stderr)
     return saved_files
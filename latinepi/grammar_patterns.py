@@ -6,10 +6,155 @@ just known name patterns. It leverages the highly formulaic nature of Roman insc
 """
 
 import re
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+from latinepi.parallel import iter_batch_results
 
 
-def extract_with_grammar_templates(text: str) -> Dict[str, Dict[str, Any]]:
+# Patterns are compiled once at import; the per-call helpers only run searches.
+
+_WORD_RE = re.compile(r'\b[A-Z]+\b')
+
+# Typical name endings for position-based candidates ([AE]$ is A or E)
+_NAME_ENDINGS = ('US', 'A', 'E', 'UM')
+
+# Known formula words that are never part of a name
+_FORMULA_WORDS = frozenset({
+    'D', 'M', 'S', 'FECIT', 'FECERVNT', 'POSUIT', 'POSUERUNT',
+    'VIXIT', 'ANNIS', 'ANNOS', 'PATER', 'MATER', 'FILIUS', 'FILIA',
+    'PATRI', 'MATRI', 'FILIO', 'FILIAE', 'CONIUGI', 'HERES',
+    'LEG', 'LEGIONIS', 'MIL', 'MILES', 'CENTURIO', 'ET'
+})
+
+# Verbs that mark the preceding name as the dedicator
+_DEDICATOR_VERB_WORDS = frozenset({'FECIT', 'FECERVNT', 'POSUIT'})
+
+
+def _anchor_word(fragment: str) -> Optional[str]:
+    """
+    Return the literal word a template fragment matches, or None.
+
+    Each template requires its keyword (relationship word, verb, adjective) to
+    occur as a whole word. When that keyword is a plain word, the template can
+    be skipped for texts that do not contain it.
+    """
+    word = fragment.replace('[UU]', 'U')
+    return word if word.isalpha() and word.isupper() else None
+
+
+# Genitive feminine + dative relationship word, in order of precedence
+# Pattern: NAME-AE NAME-AE FILIAE/MATRI/CONIVGI/SORORI
+_GENITIVE_FEMININE_RELATIONSHIPS = {
+    'FILIAE': ('daughter', 0.90),
+    'MATRI': ('mother', 0.90),
+    'CONI[UU]GI': ('wife', 0.88),
+    'SORORI': ('sister', 0.88),
+    'A[UU]IAE': ('grandmother', 0.85),
+    'NEPOTI': ('granddaughter', 0.85),
+}
+
+# Genitive masculine + dative relationship word, in order of precedence
+# Pattern: NAME-I NAME-I PATRI/FILIO/FRATRI
+_GENITIVE_MASCULINE_RELATIONSHIPS = {
+    'PATRI': ('father', 0.90),
+    'FILIO': ('son', 0.90),
+    'FRATRI': ('brother', 0.88),
+    'A[UU]O': ('grandfather', 0.85),
+    'NEPOTI': ('grandson', 0.85),
+}
+
+
+def _genitive_pattern(name_pattern: str, relationships: Dict[str, Tuple[str, float]]):
+    """
+    Compile one pattern for all relationship words of a genitive template.
+
+    The pattern is a lookahead so finditer reports every start position,
+    including overlapping candidates. Returns the pattern and a lookup from
+    the matched relationship word to (precedence, value, confidence).
+    """
+    pattern = re.compile(
+        r'(?=\b(' + name_pattern + r')\s+(' + name_pattern + r')\s+('
+        + '|'.join(relationships) + r')\b)'
+    )
+    lookup = {
+        _anchor_word(rel_word): (rank, rel_value, rel_conf)
+        for rank, (rel_word, (rel_value, rel_conf)) in enumerate(relationships.items())
+    }
+    return pattern, lookup
+
+
+_GENITIVE_FEMININE_RE, _GENITIVE_FEMININE_LOOKUP = _genitive_pattern(
+    '[A-Z]+AE', _GENITIVE_FEMININE_RELATIONSHIPS
+)
+_GENITIVE_MASCULINE_RE, _GENITIVE_MASCULINE_LOOKUP = _genitive_pattern(
+    '[A-Z]+I', _GENITIVE_MASCULINE_RELATIONSHIPS
+)
+
+# Common dedication verbs, each with its (relationship, three-name, two-name)
+# dedicator patterns
+_DEDICATOR_PATTERNS = [
+    (
+        _anchor_word(verb),
+        # Nomen + Cognomen + PATER/MATER + FECIT (relationship before verb)
+        re.compile(r'\b([A-Z]+[UU]S)\s+([A-Z]+[UU]S)\s+(PATER|MATER|FILI[UU]S|FILIA|FRATER|SOROR|HERES)\s+' + verb + r'\b'),
+        # Praenomen (abbrev or full) + Nomen + Cognomen + VERB
+        re.compile(r'\b([A-Z]{1,3}\.?)\s+([A-Z]+[UU]S)\s+([A-Z]+[UU]S)\s+' + verb + r'\b'),
+        # Nomen + Cognomen + VERB
+        re.compile(r'\b([A-Z]+[UU]S)\s+([A-Z]+[UU]S)\s+' + verb + r'\b'),
+    )
+    for verb in ['FECIT', 'FECERVNT', 'POS[UU]IT', 'POS[UU]ERVNT',
+                 'C[UU]RA[UU]IT', 'C[UU]RA[UU]ERVNT']
+]
+
+# Relationship word before FECIT (e.g., PATER FECIT)
+_RELATIONSHIP_BEFORE_FECIT_PATTERNS = [
+    (_anchor_word(rel_pattern), re.compile(r'\b' + rel_pattern + r'\s+(?:FECIT|POS[UU]IT|C[UU]RA[UU]IT)\b'), rel_value, rel_conf)
+    for rel_pattern, (rel_value, rel_conf) in {
+        'PATER': ('father', 0.88),
+        'MATER': ('mother', 0.88),
+        'FILI[UU]S': ('son', 0.88),
+        'FILIA': ('daughter', 0.88),
+        'CONI[UU]X': ('spouse', 0.85),
+        'FRATER': ('brother', 0.85),
+        'SOROR': ('sister', 0.85),
+        'HERES': ('heir', 0.88),
+    }.items()
+]
+
+# NAME NAME-I F. (son/daughter of)
+_PATRONYMIC_RE = re.compile(r'\b([A-Z]+[UU]S)\s+([A-Z]+I)\s+F\.?\b')
+
+# NAME-IS/I FILIUS/FILIA
+_FILIUS_RE = re.compile(r'\b([A-Z]+I(?:S)?)\s+FILI[UU]S\b')
+_FILIA_RE = re.compile(r'\b([A-Z]+I(?:S)?)\s+FILIA\b')
+
+# Relationship adjectives (carissimo/a/ae, piissimo/a/ae, dulcissimo/a/ae)
+_RELATIONSHIP_ADJECTIVE_PATTERNS = [
+    (_anchor_word(adj_pattern), re.compile(r'\b' + adj_pattern + r'\b'), adj_value, adj_conf)
+    for adj_pattern, (adj_value, adj_conf) in {
+        'CARISSIM[AOE]+': ('dearest', 0.75),
+        'PIISSIM[AOE]+': ('most devoted', 0.75),
+        'D[UU]LCISSIM[AOE]+': ('sweetest', 0.75),
+        r'BENE\s+MERENTI': ('well-deserving', 0.75),
+        'INCOMPARABILI': ('incomparable', 0.75),
+    }.items()
+]
+
+# Words at least one of which must be present for a helper to match anything
+_GENITIVE_ANCHORS = frozenset(_GENITIVE_FEMININE_LOOKUP) | frozenset(_GENITIVE_MASCULINE_LOOKUP)
+_DEDICATION_VERB_ANCHORS = frozenset(entry[0] for entry in _DEDICATOR_PATTERNS)
+_FILIATION_ANCHORS = frozenset({'FILIUS', 'FILIA'})
+_SENTIMENT_ANCHORS = frozenset({'MERENTI', 'INCOMPARABILI'})
+
+# NAME ET NAME FECERUNT, matched as the three words before and the three
+# words plus verb after each ET (normalized text has single spaces)
+_MULTIPLE_DEDICATORS_BEFORE_ET_RE = re.compile(r'\b([A-Z]+[UU]S) ([A-Z]+[UU]S) ([A-Z]+)$')
+_MULTIPLE_DEDICATORS_AFTER_ET_RE = re.compile(r'([A-Z]+) ([A-Z]+) ([A-Z]+) FECERVNT\b')
+
+
+def extract_with_grammar_templates(
+    text: str,
+    text_upper: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
     """
     Extract entities using grammatical template patterns.
 
@@ -21,28 +166,99 @@ def extract_with_grammar_templates(text: str) -> Dict[str, Dict[str, Any]]:
 
     Args:
         text: The inscription text to analyze
+        text_upper: text.upper(), if the caller already has it
 
     Returns:
         Dictionary of extracted entities with values and confidence scores
     """
     entities = {}
 
-    # Normalize text
-    normalized_text = text.upper().replace('V', 'U').replace('<BR>', ' ').replace('<BR/>', ' ')
-    normalized_text = re.sub(r'\s+', ' ', normalized_text.strip())
+    if text_upper is None:
+        text_upper = text.upper()
 
-    # Extract using various grammatical templates
-    entities.update(_extract_genitive_relationships(normalized_text))
-    entities.update(_extract_dedicator_patterns(normalized_text))
-    entities.update(_extract_patronymic_patterns(normalized_text))
-    entities.update(_extract_filiation_patterns(normalized_text))
-    entities.update(_extract_age_relationship_patterns(normalized_text))
-    entities.update(_extract_multiple_dedicators(normalized_text))
+    # Normalize text
+    normalized_text = text_upper.replace('V', 'U').replace('<BR>', ' ').replace('<BR/>', ' ')
+    # str.split() collapses and strips whitespace runs without a regex pass
+    normalized_text = ' '.join(normalized_text.split())
+
+    # Collect the words of the text once; templates whose keyword is absent
+    # are skipped without running their regex
+    words = set(_WORD_RE.findall(normalized_text))
+
+    # Extract using various grammatical templates, skipping any template
+    # family whose marker words are absent
+    if not words.isdisjoint(_GENITIVE_ANCHORS):
+        entities.update(_extract_genitive_relationships(normalized_text, words))
+    if not words.isdisjoint(_DEDICATION_VERB_ANCHORS):
+        entities.update(_extract_dedicator_patterns(normalized_text, words))
+    if 'F' in words:
+        entities.update(_extract_patronymic_patterns(normalized_text))
+    if not words.isdisjoint(_FILIATION_ANCHORS):
+        entities.update(_extract_filiation_patterns(normalized_text, words))
+    # CARISSIM-, PIISSIM- and DULCISSIM- all contain ISSIM
+    if 'ISSIM' in normalized_text or not words.isdisjoint(_SENTIMENT_ANCHORS):
+        entities.update(_extract_age_relationship_patterns(normalized_text, words))
+    if 'FECERVNT' in words and ' ET ' in normalized_text:
+        entities.update(_extract_multiple_dedicators(normalized_text, words))
 
     return entities
 
 
-def _extract_genitive_relationships(text: str) -> Dict[str, Dict[str, Any]]:
+def extract_with_grammar_templates_batch(
+    texts: List[str],
+    workers: Optional[int] = None,
+    chunksize: int = 64
+) -> List[Dict[str, Dict[str, Any]]]:
+    """
+    Extract entities from many texts using grammatical template patterns.
+
+    Template matching is pure CPU work, so large corpora are split across
+    worker processes. Small inputs, or workers <= 1, run in this process.
+
+    Args:
+        texts: The inscription texts to analyze
+        workers: Number of worker processes (default: one per CPU)
+        chunksize: Texts sent to a worker at a time
+
+    Returns:
+        One entity dictionary per input text, in input order
+    """
+    results = []
+    for _, batch_results in iter_batch_results(
+        _extract_with_grammar_templates_list, texts, workers, chunksize
+    ):
+        results.extend(batch_results)
+    return results
+
+
+def _extract_with_grammar_templates_list(texts: List[str]) -> List[Dict[str, Dict[str, Any]]]:
+    """Extract template entities for each text; the unit of work sent to workers."""
+    return [extract_with_grammar_templates(text) for text in texts]
+
+
+def _best_genitive_match(pattern, lookup, text: str) -> Optional[Tuple[str, str, str, float]]:
+    """
+    Scan once for all relationship words and keep the highest-precedence one.
+
+    Among matches for the same relationship word the leftmost wins, which is
+    what a separate search per word would return.
+
+    Returns:
+        (name1, name2, relationship value, confidence), or None
+    """
+    best = None
+    best_rank = len(lookup)
+    for match in pattern.finditer(text):
+        rank, rel_value, rel_conf = lookup[match.group(3)]
+        if rank < best_rank:
+            best = (match.group(1), match.group(2), rel_value, rel_conf)
+            best_rank = rank
+            if rank == 0:
+                break
+    return best
+
+
+def _extract_genitive_relationships(text: str, words: set) -> Dict[str, Dict[str, Any]]:
     """
     Extract relationships using genitive + dative patterns.
 
@@ -54,68 +270,52 @@ def _extract_genitive_relationships(text: str) -> Dict[str, Dict[str, Any]]:
     entities = {}
 
     # Genitive feminine + dative relationship word
-    # Pattern: NAME-AE NAME-AE FILIAE/MATRI/CONIVGI/SORORI
-    relationship_words = {
-        'FILIAE': ('daughter', 0.90),
-        'MATRI': ('mother', 0.90),
-        'CONI[UU]GI': ('wife', 0.88),
-        'SORORI': ('sister', 0.88),
-        'A[UU]IAE': ('grandmother', 0.85),
-        'NEPOTI': ('granddaughter', 0.85),
-    }
-
-    for rel_word, (rel_value, rel_conf) in relationship_words.items():
-        # Two-name genitive pattern (nomen + cognomen in genitive)
-        pattern = r'\b([A-Z]+AE)\s+([A-Z]+AE)\s+' + rel_word + r'\b'
-        match = re.search(pattern, text)
-        if match and 'deceased_name' not in entities:
-            name1 = match.group(1).replace('U', 'V')  # Convert back to standard
-            name2 = match.group(2).replace('U', 'V')
-            # Remove -AE, add -a, and capitalize properly (first letter upper, rest lower)
-            name1_nom = name1[:-2].capitalize() + "a"
-            name2_nom = name2[:-2].capitalize() + "a"
-            entities['deceased_name'] = {
-                'value': f"{name1_nom} {name2_nom}",
-                'confidence': 0.82
-            }
-            entities['deceased_relationship'] = {
-                'value': rel_value,
-                'confidence': rel_conf
-            }
-            break
+    # Two-name genitive pattern (nomen + cognomen in genitive)
+    match = _best_genitive_match(_GENITIVE_FEMININE_RE, _GENITIVE_FEMININE_LOOKUP, text)
+    if match:
+        name1, name2, rel_value, rel_conf = match
+        name1 = name1.replace('U', 'V')  # Convert back to standard
+        name2 = name2.replace('U', 'V')
+        # Remove -AE, add -a, and capitalize properly (first letter upper, rest lower)
+        name1_nom = name1[:-2].capitalize() + "a"
+        name2_nom = name2[:-2].capitalize() + "a"
+        entities['deceased_name'] = {
+            'value': f"{name1_nom} {name2_nom}",
+            'confidence': 0.82
+        }
+        entities['deceased_relationship'] = {
+            'value': rel_value,
+            'confidence': rel_conf
+        }
+        return entities
 
     # Genitive masculine + dative relationship word
-    # Pattern: NAME-I NAME-I PATRI/FILIO/FRATRI
-    relationship_words_masc = {
-        'PATRI': ('father', 0.90),
-        'FILIO': ('son', 0.90),
-        'FRATRI': ('brother', 0.88),
-        'A[UU]O': ('grandfather', 0.85),
-        'NEPOTI': ('grandson', 0.85),
-    }
-
-    for rel_word, (rel_value, rel_conf) in relationship_words_masc.items():
-        # Two-name genitive pattern
-        pattern = r'\b([A-Z]+I)\s+([A-Z]+I)\s+' + rel_word + r'\b'
-        match = re.search(pattern, text)
-        if match and 'deceased_name' not in entities:
-            name1 = match.group(1).replace('U', 'V')
-            name2 = match.group(2).replace('U', 'V')
-            # Genitive -i could be from -ius or -us, assume -ius (more common for nomina)
-            entities['deceased_name'] = {
-                'value': f"{name1[:-1]}us {name2[:-1]}us",  # Remove -I, add -us
-                'confidence': 0.80
-            }
-            entities['deceased_relationship'] = {
-                'value': rel_value,
-                'confidence': rel_conf
-            }
-            break
+    # Two-name genitive pattern
+    match = _best_genitive_match(_GENITIVE_MASCULINE_RE, _GENITIVE_MASCULINE_LOOKUP, text)
+    if match:
+        name1, name2, rel_value, rel_conf = match
+        name1 = name1.replace('U', 'V')
+        name2 = name2.replace('U', 'V')
+        # Genitive -i could be from -ius or -us, assume -ius (more common for nomina)
+        entities['deceased_name'] = {
+            'value': f"{name1[:-1]}us {name2[:-1]}us",  # Remove -I, add -us
+            'confidence': 0.80
+        }
+        entities['deceased_relationship'] = {
+            'value': rel_value,
+            'confidence': rel_conf
+        }
 
     return entities
 
 
-def _extract_dedicator_patterns(text: str) -> Dict[str, Dict[str, Any]]:
+def _to_proper(word: str) -> str:
+    """Convert an uppercase name to proper case with consonantal v (VIBIUS → Vibivs)."""
+    word = word.lower().replace('u', 'v')
+    return word[:1].upper() + word[1:]
+
+
+def _extract_dedicator_patterns(text: str, words: set) -> Dict[str, Dict[str, Any]]:
     """
     Extract dedicators using FECIT/POSUIT/CURAVIT patterns.
 
@@ -127,17 +327,15 @@ def _extract_dedicator_patterns(text: str) -> Dict[str, Dict[str, Any]]:
     entities = {}
 
     # Common dedication verbs
-    dedication_verbs = ['FECIT', 'FECERVNT', 'POS[UU]IT', 'POS[UU]ERVNT',
-                        'C[UU]RA[UU]IT', 'C[UU]RA[UU]ERVNT']
-
-    for verb in dedication_verbs:
+    for anchor, relationship_pattern, three_name_pattern, two_name_pattern in _DEDICATOR_PATTERNS:
+        if anchor is not None and anchor not in words:
+            continue
         # Pattern: Nomen + Cognomen + PATER/MATER + FECIT (relationship before verb)
-        pattern = r'\b([A-Z]+[UU]S)\s+([A-Z]+[UU]S)\s+(PATER|MATER|FILI[UU]S|FILIA|FRATER|SOROR|HERES)\s+' + verb + r'\b'
-        match = re.search(pattern, text)
+        match = relationship_pattern.search(text)
         if match and 'dedicator' not in entities:
             # Convert to proper case: U→v (for consonant v), then capitalize
-            nomen = match.group(1).replace('U', 'v').lower().capitalize()
-            cogn = match.group(2).replace('U', 'v').lower().capitalize()
+            nomen = _to_proper(match.group(1))
+            cogn = _to_proper(match.group(2))
             entities['dedicator'] = {
                 'value': f"{nomen} {cogn}",
                 'confidence': 0.85
@@ -146,12 +344,11 @@ def _extract_dedicator_patterns(text: str) -> Dict[str, Dict[str, Any]]:
 
         # Pattern: Praenomen (abbrev or full) + Nomen + Cognomen + VERB
         # Three-name pattern
-        pattern = r'\b([A-Z]{1,3}\.?)\s+([A-Z]+[UU]S)\s+([A-Z]+[UU]S)\s+' + verb + r'\b'
-        match = re.search(pattern, text)
+        match = three_name_pattern.search(text)
         if match and 'dedicator' not in entities:
             praen = match.group(1)  # Keep abbreviations as-is (already uppercase)
-            nomen = match.group(2).replace('U', 'v').lower().capitalize()
-            cogn = match.group(3).replace('U', 'v').lower().capitalize()
+            nomen = _to_proper(match.group(2))
+            cogn = _to_proper(match.group(3))
             entities['dedicator'] = {
                 'value': f"{praen} {nomen} {cogn}",
                 'confidence': 0.85
@@ -159,11 +356,10 @@ def _extract_dedicator_patterns(text: str) -> Dict[str, Dict[str, Any]]:
             break
 
         # Two-name pattern (nomen + cognomen)
-        pattern = r'\b([A-Z]+[UU]S)\s+([A-Z]+[UU]S)\s+' + verb + r'\b'
-        match = re.search(pattern, text)
+        match = two_name_pattern.search(text)
         if match and 'dedicator' not in entities:
-            nomen = match.group(1).replace('U', 'v').lower().capitalize()
-            cogn = match.group(2).replace('U', 'v').lower().capitalize()
+            nomen = _to_proper(match.group(1))
+            cogn = _to_proper(match.group(2))
             entities['dedicator'] = {
                 'value': f"{nomen} {cogn}",
                 'confidence': 0.82
@@ -171,20 +367,10 @@ def _extract_dedicator_patterns(text: str) -> Dict[str, Dict[str, Any]]:
             break
 
     # Check for relationship word before FECIT (e.g., PATER FECIT)
-    relationship_before_fecit = {
-        'PATER': ('father', 0.88),
-        'MATER': ('mother', 0.88),
-        'FILI[UU]S': ('son', 0.88),
-        'FILIA': ('daughter', 0.88),
-        'CONI[UU]X': ('spouse', 0.85),
-        'FRATER': ('brother', 0.85),
-        'SOROR': ('sister', 0.85),
-        'HERES': ('heir', 0.88),
-    }
-
-    for rel_pattern, (rel_value, rel_conf) in relationship_before_fecit.items():
-        pattern = r'\b' + rel_pattern + r'\s+(?:FECIT|POS[UU]IT|C[UU]RA[UU]IT)\b'
-        match = re.search(pattern, text)
+    for anchor, pattern, rel_value, rel_conf in _RELATIONSHIP_BEFORE_FECIT_PATTERNS:
+        if anchor is not None and anchor not in words:
+            continue
+        match = pattern.search(text)
         if match and 'dedicator_relationship' not in entities:
             entities['dedicator_relationship'] = {
                 'value': rel_value,
@@ -207,8 +393,7 @@ def _extract_patronymic_patterns(text: str) -> Dict[str, Dict[str, Any]]:
     entities = {}
 
     # Pattern: NAME NAME-I F. (son/daughter of)
-    pattern = r'\b([A-Z]+[UU]S)\s+([A-Z]+I)\s+F\.?\b'
-    match = re.search(pattern, text)
+    match = _PATRONYMIC_RE.search(text)
     if match and 'patronymic' not in entities:
         name = match.group(1).replace('U', 'V')
         father_gen = match.group(2).replace('U', 'V')
@@ -226,7 +411,7 @@ def _extract_patronymic_patterns(text: str) -> Dict[str, Dict[str, Any]]:
     return entities
 
 
-def _extract_filiation_patterns(text: str) -> Dict[str, Dict[str, Any]]:
+def _extract_filiation_patterns(text: str, words: set) -> Dict[str, Dict[str, Any]]:
     """
     Extract full filiation patterns (FILIUS/FILIA + father's name).
 
@@ -236,8 +421,7 @@ def _extract_filiation_patterns(text: str) -> Dict[str, Dict[str, Any]]:
     entities = {}
 
     # Pattern: NAME-IS/I FILIUS/FILIA
-    pattern = r'\b([A-Z]+I(?:S)?)\s+FILI[UU]S\b'
-    match = re.search(pattern, text)
+    match = 'FILIUS' in words and _FILIUS_RE.search(text)
     if match and 'father_name' not in entities:
         father_gen = match.group(1).replace('U', 'V')
         # Convert genitive to nominative
@@ -254,8 +438,7 @@ def _extract_filiation_patterns(text: str) -> Dict[str, Dict[str, Any]]:
             'confidence': 0.92
         }
 
-    pattern = r'\b([A-Z]+I(?:S)?)\s+FILIA\b'
-    match = re.search(pattern, text)
+    match = 'FILIA' in words and _FILIA_RE.search(text)
     if match and 'father_name' not in entities:
         father_gen = match.group(1).replace('U', 'V')
         if father_gen.endswith('IS'):
@@ -274,7 +457,7 @@ def _extract_filiation_patterns(text: str) -> Dict[str, Dict[str, Any]]:
     return entities
 
 
-def _extract_age_relationship_patterns(text: str) -> Dict[str, Dict[str, Any]]:
+def _extract_age_relationship_patterns(text: str, words: set) -> Dict[str, Dict[str, Any]]:
     """
     Extract patterns combining age with relationships.
 
@@ -284,17 +467,10 @@ def _extract_age_relationship_patterns(text: str) -> Dict[str, Dict[str, Any]]:
     entities = {}
 
     # Pattern: relationship adjectives (carissimo/a/ae, piissimo/a/ae, dulcissimo/a/ae)
-    relationship_adjectives = {
-        'CARISSIM[AOE]+': ('dearest', 0.75),
-        'PIISSIM[AOE]+': ('most devoted', 0.75),
-        'D[UU]LCISSIM[AOE]+': ('sweetest', 0.75),
-        'BENE\s+MERENTI': ('well-deserving', 0.75),
-        'INCOMPARABILI': ('incomparable', 0.75),
-    }
-
-    for adj_pattern, (adj_value, adj_conf) in relationship_adjectives.items():
-        pattern = r'\b' + adj_pattern + r'\b'
-        match = re.search(pattern, text)
+    for anchor, pattern, adj_value, adj_conf in _RELATIONSHIP_ADJECTIVE_PATTERNS:
+        if anchor is not None and anchor not in words:
+            continue
+        match = pattern.search(text)
         if match and 'dedication_sentiment' not in entities:
             entities['dedication_sentiment'] = {
                 'value': adj_value,
@@ -305,7 +481,29 @@ def _extract_age_relationship_patterns(text: str) -> Dict[str, Dict[str, Any]]:
     return entities
 
 
-def _extract_multiple_dedicators(text: str) -> Dict[str, Dict[str, Any]]:
+def _match_multiple_dedicators(text: str) -> Optional[Tuple[str, ...]]:
+    """
+    Find the first NAME NAME REL ET NAME NAME REL FECERVNT sequence.
+
+    Each ET is checked with two short anchored patterns, one on the three
+    words before it and one on the words after it, instead of one long
+    pattern that backtracks across every run of capitalized words.
+
+    Returns:
+        The six captured words, or None if there is no match
+    """
+    pos = text.find(' ET ')
+    while pos != -1:
+        before = _MULTIPLE_DEDICATORS_BEFORE_ET_RE.search(' '.join(text[:pos].rsplit(' ', 3)[-3:]))
+        if before:
+            after = _MULTIPLE_DEDICATORS_AFTER_ET_RE.match(text, pos + 4)
+            if after:
+                return before.groups() + after.groups()
+        pos = text.find(' ET ', pos + 1)
+    return None
+
+
+def _extract_multiple_dedicators(text: str, words: set) -> Dict[str, Dict[str, Any]]:
     """
     Extract patterns with multiple dedicators (ET pattern).
 
@@ -315,15 +513,14 @@ def _extract_multiple_dedicators(text: str) -> Dict[str, Dict[str, Any]]:
     entities = {}
 
     # Pattern: NAME ET NAME FECERUNT
-    pattern = r'\b([A-Z]+[UU]S)\s+([A-Z]+[UU]S)\s+([A-Z]+)\s+ET\s+([A-Z]+)\s+([A-Z]+)\s+([A-Z]+)\s+FECERVNT\b'
-    match = re.search(pattern, text)
+    match = _match_multiple_dedicators(text)
     if match:
-        name1_1 = match.group(1).replace('U', 'V')
-        name1_2 = match.group(2).replace('U', 'V')
-        rel1 = match.group(3).replace('U', 'V')
-        name2_1 = match.group(4).replace('U', 'V')
-        name2_2 = match.group(5).replace('U', 'V')
-        rel2 = match.group(6).replace('U', 'V')
+        name1_1 = match[0].replace('U', 'V')
+        name1_2 = match[1].replace('U', 'V')
+        rel1 = match[2].replace('U', 'V')
+        name2_1 = match[3].replace('U', 'V')
+        name2_2 = match[4].replace('U', 'V')
+        rel2 = match[5].replace('U', 'V')
 
         entities['dedicator_1'] = {
             'value': f"{name1_1} {name1_2}",
@@ -361,36 +558,34 @@ def extract_unknown_names_by_position(text: str) -> List[Tuple[str, str, float]]
 
     # Extract capitalized word sequences that look like names
     # (2-3 consecutive capitalized words not matching known formula words)
-    formula_words = {
-        'D', 'M', 'S', 'FECIT', 'FECERVNT', 'POSUIT', 'POSUERUNT',
-        'VIXIT', 'ANNIS', 'ANNOS', 'PATER', 'MATER', 'FILIUS', 'FILIA',
-        'PATRI', 'MATRI', 'FILIO', 'FILIAE', 'CONIUGI', 'HERES',
-        'LEG', 'LEGIONIS', 'MIL', 'MILES', 'CENTURIO', 'ET'
-    }
 
     # Find sequences of 2-3 capitalized words
-    words = re.findall(r'\b[A-Z]+\b', normalized_text)
+    words = _WORD_RE.findall(normalized_text)
+
+    # Flag each word once: not a known formula word, and ending in a typical
+    # name ending
+    name_like = [
+        word not in _FORMULA_WORDS and word.endswith(_NAME_ENDINGS)
+        for word in words
+    ]
 
     for i in range(len(words) - 1):
-        # Two-word name pattern
-        if words[i] not in formula_words and words[i+1] not in formula_words:
-            # Check if they look like names (ending in typical name endings)
-            if (re.search(r'[UU]S$|[AE]$|[UU]M$', words[i]) and
-                re.search(r'[UU]S$|[AE]$|[UU]M$', words[i+1])):
-                name = f"{words[i]} {words[i+1]}".replace('U', 'V')
-                # Determine position type by context
-                position = 'unknown'
-                confidence = 0.60
-
-                # Check if before FECIT → likely dedicator
-                if i+2 < len(words) and words[i+2] in ['FECIT', 'FECERVNT', 'POSUIT']:
-                    position = 'dedicator'
-                    confidence = 0.75
-                # Check if genitive ending → likely deceased
-                elif words[i].endswith(('I', 'AE')) and words[i+1].endswith(('I', 'AE')):
-                    position = 'deceased_genitive'
-                    confidence = 0.70
-
-                names.append((name, position, confidence))
+        # Two-word name pattern (both words look like names)
+        if name_like[i] and name_like[i+1]:
+            name = f"{words[i]} {words[i+1]}".replace('U', 'V')
+            # Determine position type by context
+            position = 'unknown'
+            confidence = 0.60
+
+            # Check if before FECIT → likely dedicator
+            if i+2 < len(words) and words[i+2] in _DEDICATOR_VERB_WORDS:
+                position = 'dedicator'
+                confidence = 0.75
+            # Check if genitive ending → likely deceased
+            elif words[i].endswith(('I', 'AE')) and words[i+1].endswith(('I', 'AE')):
+                position = 'deceased_genitive'
+                confidence = 0.70
+
+            names.append((name, position, confidence))
 
     return names
@@ -9,7 +9,9 @@ This is the main orchestration module that intelligently combines:
 - Phase 3: Dependency parsing (complex relationships)
 """
 
+from functools import partial
 from typing import Dict, Any, List, Optional
+from latinepi.parallel import iter_batch_results
 from latinepi.parser import _extract_entities_stub
 from latinepi.grammar_patterns import (
     extract_with_grammar_templates,
@@ -17,6 +19,23 @@ from latinepi.grammar_patterns import (
 )
 
 
+# Entity groups that should be consolidated; the first key is the base name
+_ENTITY_GROUPS = (
+    ('deceased_name', 'deceased_name_morphology', 'deceased_name_dependency'),
+    ('dedicator', 'dedicator_morphology', 'dedicator_dependency'),
+    ('relationship', 'relationship_morphology', 'relationship_dependency',
+     'deceased_relationship'),
+    ('location', 'location_morphology'),
+)
+
+# Entity key -> (group index, position within the group)
+_KEY_TO_GROUP = {
+    key: (group_index, member_index)
+    for group_index, group in enumerate(_ENTITY_GROUPS)
+    for member_index, key in enumerate(group)
+}
+
+
 class HybridLatinParser:
     """
     Hybrid parser combining multiple extraction strategies.
@@ -34,7 +53,8 @@ class HybridLatinParser:
         self,
         use_morphology: bool = True,
         use_dependencies: bool = False,
-        min_confidence: float = 0.5
+        min_confidence: float = 0.5,
+        parse_cache_dir: Optional[str] = None
     ):
         """
         Initialize the hybrid parser.
@@ -43,15 +63,25 @@ class HybridLatinParser:
             use_morphology: Enable Phase 2 (morphological analysis)
             use_dependencies: Enable Phase 3 (dependency parsing)
             min_confidence: Minimum confidence threshold for entities
+            parse_cache_dir: Directory for the persistent dependency cache
         """
         self.use_morphology = use_morphology
         self.use_dependencies = use_dependencies
         self.min_confidence = min_confidence
+        self.parse_cache_dir = parse_cache_dir
 
         # Lazy-load analyzers
         self._morphology_analyzer = None
         self._dependency_parser = None
 
+        # Load CLTK models in the background while phases 0-1 run
+        analyzer = self._get_morphology_analyzer()
+        if analyzer:
+            analyzer.warm_up()
+        parser = self._get_dependency_parser()
+        if parser:
+            parser.warm_up()
+
     def _get_morphology_analyzer(self):
         """Lazy-load morphology analyzer."""
         if self._morphology_analyzer is None and self.use_morphology:
@@ -89,24 +119,87 @@ class HybridLatinParser:
         Returns:
             Dictionary of extracted entities with confidence scores
         """
-        entities = {}
+        entities = self._extract_without_dependencies(text, verbose)
 
-        # Phase 0: Pattern matching (original stub)
-        pattern_entities = _extract_entities_stub(text)
-        if verbose:
-            for key, value in pattern_entities.items():
-                value['extraction_phase'] = 'pattern_matching'
-        entities.update(pattern_entities)
+        # Phase 3: Dependency parsing (if enabled and needed)
+        dep_entities = None
+        if self.use_dependencies and self._needs_dependencies(entities):
+            parser = self._get_dependency_parser()
+            if parser:
+                dep_entities = parser.extract_entities_by_dependencies(
+                    text, cache_dir=self.parse_cache_dir
+                )
 
-        # Phase 1: Grammatical templates
-        grammar_entities = extract_with_grammar_templates(text)
-        entities = self._merge_entities(
-            entities,
-            grammar_entities,
-            prefer_higher_confidence=True,
-            verbose=verbose,
-            phase_name='grammar_templates'
-        )
+        return self._finalize_entities(entities, dep_entities, verbose)
+
+    def extract_entities_batch(
+        self,
+        texts: List[str],
+        verbose: bool = False
+    ) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Extract entities from a batch of texts using the hybrid approach.
+
+        Texts that need morphological analysis or dependency parsing are
+        sent to the analyzers together, so repeated texts in a batch are
+        only run through CLTK once.
+
+        Args:
+            texts: The inscription texts to analyze
+            verbose: If True, include metadata about extraction sources
+
+        Returns:
+            List of entity dictionaries, in the same order as texts
+        """
+        template_results = [self._extract_templates(text, verbose) for text in texts]
+
+        # Phase 2 for every text that needs it, in one pass over the analyzer
+        if self.use_morphology:
+            pending = [i for i, entities in enumerate(template_results)
+                       if self._needs_morphology(entities)]
+            if pending:
+                analyzer = self._get_morphology_analyzer()
+                if analyzer:
+                    batch = analyzer.extract_entities_by_morphology_batch(
+                        [texts[i] for i in pending]
+                    )
+                    for i, morph_entities in zip(pending, batch):
+                        template_results[i] = self._merge_entities(
+                            template_results[i],
+                            morph_entities,
+                            prefer_higher_confidence=True,
+                            verbose=verbose,
+                            phase_name='morphology'
+                        )
+
+        dep_results = [None] * len(texts)
+
+        if self.use_dependencies:
+            pending = [i for i, entities in enumerate(template_results)
+                       if self._needs_dependencies(entities)]
+            if pending:
+                parser = self._get_dependency_parser()
+                if parser:
+                    batch = parser.extract_entities_by_dependencies_batch(
+                        [texts[i] for i in pending], cache_dir=self.parse_cache_dir
+                    )
+                    for i, dep_entities in zip(pending, batch):
+                        dep_results[i] = dep_entities
+
+        return [
+            self._finalize_entities(entities, dep_entities, verbose)
+            for entities, dep_entities in zip(template_results, dep_results)
+        ]
+
+    def _extract_without_dependencies(
+        self,
+        text: str,
+        verbose: bool
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run phases 0-2 (patterns, grammar templates, morphology)."""
+        # Every phase matches against the uppercased text
+        text_upper = text.upper()
+        entities = self._extract_templates(text, verbose, text_upper)
 
         # Phase 2: Morphological analysis (if enabled and needed)
         if self.use_morphology:
@@ -114,7 +207,9 @@ class HybridLatinParser:
             if morphology_needed:
                 analyzer = self._get_morphology_analyzer()
                 if analyzer:
-                    morph_entities = analyzer.extract_entities_by_morphology(text)
+                    morph_entities = analyzer.extract_entities_by_morphology(
+                        text, text_upper
+                    )
                     entities = self._merge_entities(
                         entities,
                         morph_entities,
@@ -123,20 +218,52 @@ class HybridLatinParser:
                         phase_name='morphology'
                     )
 
-        # Phase 3: Dependency parsing (if enabled and needed)
-        if self.use_dependencies:
-            dependency_needed = self._needs_dependencies(entities)
-            if dependency_needed:
-                parser = self._get_dependency_parser()
-                if parser:
-                    dep_entities = parser.extract_entities_by_dependencies(text)
-                    entities = self._merge_entities(
-                        entities,
-                        dep_entities,
-                        prefer_higher_confidence=True,
-                        verbose=verbose,
-                        phase_name='dependencies'
-                    )
+        return entities
+
+    def _extract_templates(
+        self,
+        text: str,
+        verbose: bool,
+        text_upper: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run phases 0-1 (patterns, grammar templates)."""
+        if text_upper is None:
+            text_upper = text.upper()
+
+        # Phase 0: Pattern matching (original stub). Its result is a fresh
+        # dict, so later phases merge into it directly
+        entities = _extract_entities_stub(text, text_upper)
+        if verbose:
+            for value in entities.values():
+                value['extraction_phase'] = 'pattern_matching'
+
+        # Phase 1: Grammatical templates
+        grammar_entities = extract_with_grammar_templates(text, text_upper)
+        entities = self._merge_entities(
+            entities,
+            grammar_entities,
+            prefer_higher_confidence=True,
+            verbose=verbose,
+            phase_name='grammar_templates'
+        )
+
+        return entities
+
+    def _finalize_entities(
+        self,
+        entities: Dict[str, Dict[str, Any]],
+        dep_entities: Optional[Dict[str, Dict[str, Any]]],
+        verbose: bool
+    ) -> Dict[str, Dict[str, Any]]:
+        """Merge Phase 3 results, then filter and consolidate."""
+        if dep_entities is not None:
+            entities = self._merge_entities(
+                entities,
+                dep_entities,
+                prefer_higher_confidence=True,
+                verbose=verbose,
+                phase_name='dependencies'
+            )
 
         # Filter by minimum confidence
         entities = self._filter_by_confidence(entities, self.min_confidence)
@@ -157,6 +284,9 @@ class HybridLatinParser:
         """
         Merge entities from different extraction phases.
 
+        Every caller reassigns its own working dict from the result, so
+        existing is updated in place rather than copied once per phase.
+
         Args:
             existing: Existing entities
             new: New entities to merge
@@ -165,30 +295,30 @@ class HybridLatinParser:
             phase_name: Name of the extraction phase
 
         Returns:
-            Merged entities
+            Merged entities (existing, updated in place)
         """
-        merged = existing.copy()
+        merged = existing
 
         for key, value in new.items():
             if verbose and phase_name:
                 value['extraction_phase'] = phase_name
 
-            if key not in merged:
+            # Look the key up once; entity values are never None
+            current = merged.get(key)
+            if current is None:
                 # New entity, add it
                 merged[key] = value
             else:
                 # Entity exists, decide which to keep
                 if prefer_higher_confidence:
-                    existing_conf = merged[key].get('confidence', 0)
+                    existing_conf = current.get('confidence', 0)
                     new_conf = value.get('confidence', 0)
                     if new_conf > existing_conf:
                         merged[key] = value
                     elif new_conf == existing_conf:
                         # Same confidence, add both sources
                         if verbose:
-                            if 'alternative_extraction' not in merged[key]:
-                                merged[key]['alternative_extraction'] = []
-                            merged[key]['alternative_extraction'].append({
+                            current.setdefault('alternative_extraction', []).append({
                                 'value': value['value'],
                                 'phase': phase_name
                             })
@@ -204,12 +334,22 @@ class HybridLatinParser:
         - No dedicator found
         - Low overall entity count
         """
-        has_deceased = any(k.startswith('deceased') for k in entities.keys())
-        has_dedicator = any(k.startswith('dedicator') for k in entities.keys())
-        entity_count = len(entities)
-
-        # Need morphology if missing key entities or sparse extraction
-        return not has_deceased or not has_dedicator or entity_count < 3
+        # Need morphology if extraction is sparse...
+        if len(entities) < 3:
+            return True
+
+        # ...or missing key entities; one scan, stopping once both are seen
+        has_deceased = has_dedicator = False
+        for key in entities:
+            if key.startswith('deceased'):
+                has_deceased = True
+            elif key.startswith('dedicator'):
+                has_dedicator = True
+            else:
+                continue
+            if has_deceased and has_dedicator:
+                return False
+        return True
 
     def _needs_dependencies(self, entities: Dict[str, Dict[str, Any]]) -> bool:
         """
@@ -219,15 +359,16 @@ class HybridLatinParser:
         - Complex inscription (multiple people, coordination)
         - Unclear relationships
         """
+        # Dependency parsing needed for complex cases
+        if len(entities) > 8:
+            return True
+
         # Check for coordination indicators
-        has_multiple_dedicators = any(
+        return any(
             'dedicator_1' in k or 'dedicator_2' in k
-            for k in entities.keys()
+            for k in entities
         )
 
-        # Dependency parsing needed for complex cases
-        return has_multiple_dedicators or len(entities) > 8
-
     def _filter_by_confidence(
         self,
         entities: Dict[str, Dict[str, Any]],
@@ -250,30 +391,33 @@ class HybridLatinParser:
         For example, if we have both 'deceased_name' and 'deceased_name_morphology',
         merge them into a single entity with the highest confidence.
         """
-        consolidated = {}
-        processed_groups = set()
-
-        # Define entity groups that should be consolidated
-        entity_groups = [
-            ['deceased_name', 'deceased_name_morphology', 'deceased_name_dependency'],
-            ['dedicator', 'dedicator_morphology', 'dedicator_dependency'],
-            ['relationship', 'relationship_morphology', 'relationship_dependency',
-             'deceased_relationship'],
-            ['location', 'location_morphology'],
-        ]
+        # Bin grouped entities in one pass; everything else passes through
+        buckets = {}
+        ungrouped = []
+        for key, value in entities.items():
+            position = _KEY_TO_GROUP.get(key)
+            if position is None:
+                ungrouped.append((key, value))
+            else:
+                buckets.setdefault(position[0], []).append((position[1], key, value))
 
-        for group in entity_groups:
-            # Find all entities in this group
-            found = [(key, entities[key]) for key in group if key in entities]
+        consolidated = {}
 
-            if not found:
-                continue
+        for group_index in sorted(buckets):
+            # Keep group member order so ties resolve as listed in _ENTITY_GROUPS
+            found = [(key, value) for _, key, value in sorted(buckets[group_index])]
 
-            # Find the one with highest confidence
-            best_key, best_entity = max(found, key=lambda x: x[1].get('confidence', 0))
+            # Find the one with highest confidence (first wins ties)
+            best_entity = None
+            best_confidence = None
+            for _, entity in found:
+                confidence = entity.get('confidence', 0)
+                if best_entity is None or confidence > best_confidence:
+                    best_entity = entity
+                    best_confidence = confidence
 
             # Use base name (without suffix)
-            base_name = group[0]
+            base_name = _ENTITY_GROUPS[group_index][0]
 
             # Store consolidated entity
             consolidated[base_name] = best_entity.copy()
@@ -286,29 +430,26 @@ class HybridLatinParser:
                 for key, entity in found
             ]
 
-            # Update confidence (boost if multiple sources agree)
-            if len(found) > 1:
-                # Check if values agree
-                values = [e[1]['value'] for e in found]
-                if len(set(values)) == 1:
-                    # All sources agree, boost confidence
-                    current_conf = consolidated[base_name]['confidence']
-                    consolidated[base_name]['confidence'] = min(
-                        0.98,
-                        current_conf + 0.05 * (len(found) - 1)
-                    )
-                    consolidated[base_name]['agreement'] = 'high'
-                else:
-                    consolidated[base_name]['agreement'] = 'low'
+            # A single source has nothing to agree with
+            if len(found) == 1:
+                continue
 
-            # Mark this group as processed
-            for key in group:
-                processed_groups.add(key)
+            # Update confidence (boost if multiple sources agree)
+            values = {entity['value'] for _, entity in found}
+            if len(values) == 1:
+                # All sources agree, boost confidence
+                current_conf = consolidated[base_name]['confidence']
+                consolidated[base_name]['confidence'] = min(
+                    0.98,
+                    current_conf + 0.05 * (len(found) - 1)
+                )
+                consolidated[base_name]['agreement'] = 'high'
+            else:
+                consolidated[base_name]['agreement'] = 'low'
 
         # Add entities that weren't part of any group
-        for key, value in entities.items():
-            if key not in processed_groups and key not in consolidated:
-                consolidated[key] = value
+        for key, value in ungrouped:
+            consolidated[key] = value
 
         return consolidated
 
@@ -367,6 +508,33 @@ class HybridLatinParser:
         return report
 
 
+def preload_cltk(use_morphology: bool, use_dependencies: bool):
+    """
+    Initialize the CLTK-backed singletons needed for extraction.
+
+    Used as the preload for worker pools: run in the parent before workers
+    are forked, so they inherit the loaded models, and in each worker on
+    platforms that cannot fork. Background warm-ups started by
+    HybridLatinParser are joined first, because a forked child would
+    inherit any lock they hold. Missing CLTK is left for HybridLatinParser
+    to report.
+    """
+    from latinepi.morphology import get_morphology_analyzer
+    from latinepi.dependency import get_dependency_parser
+
+    analyzer = get_morphology_analyzer()
+    parser = get_dependency_parser()
+    analyzer.wait_for_warm_up()
+    parser.wait_for_warm_up()
+    try:
+        if use_morphology:
+            analyzer._ensure_initialized()
+        if use_dependencies:
+            parser._ensure_initialized()
+    except (ImportError, RuntimeError):
+        pass
+
+
 def extract_entities_hybrid(
     text: str,
     use_morphology: bool = True,
@@ -393,3 +561,83 @@ def extract_entities_hybrid(
         min_confidence=min_confidence
     )
     return parser.extract_entities(text, verbose=verbose)
+
+
+def extract_entities_hybrid_batch(
+    texts: List[str],
+    use_morphology: bool = True,
+    use_dependencies: bool = False,
+    min_confidence: float = 0.5,
+    verbose: bool = False,
+    parse_cache_dir: Optional[str] = None
+) -> List[Dict[str, Dict[str, Any]]]:
+    """
+    Convenience function for hybrid entity extraction over a batch of texts.
+
+    Args:
+        texts: Inscription texts to analyze
+        use_morphology: Enable morphological analysis (requires CLTK)
+        use_dependencies: Enable dependency parsing (requires CLTK)
+        min_confidence: Minimum confidence threshold
+        verbose: Include extraction metadata
+        parse_cache_dir: Directory for the persistent dependency cache
+
+    Returns:
+        List of entity dictionaries, in the same order as texts
+    """
+    parser = HybridLatinParser(
+        use_morphology=use_morphology,
+        use_dependencies=use_dependencies,
+        min_confidence=min_confidence,
+        parse_cache_dir=parse_cache_dir
+    )
+    return parser.extract_entities_batch(texts, verbose=verbose)
+
+
+def extract_entities_hybrid_many(
+    texts: List[str],
+    use_morphology: bool = True,
+    use_dependencies: bool = False,
+    min_confidence: float = 0.5,
+    verbose: bool = False,
+    parse_cache_dir: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 64
+) -> List[Dict[str, Dict[str, Any]]]:
+    """
+    Hybrid entity extraction over a large corpus, split across processes.
+
+    Pattern and template matching hold the GIL, so chunks of texts are
+    extracted in worker processes. Each worker loads CLTK once and keeps
+    it for every chunk it handles. Small inputs, or workers <= 1, run in
+    this process.
+
+    Args:
+        texts: Inscription texts to analyze
+        use_morphology: Enable morphological analysis (requires CLTK)
+        use_dependencies: Enable dependency parsing (requires CLTK)
+        min_confidence: Minimum confidence threshold
+        verbose: Include extraction metadata
+        parse_cache_dir: Directory for the persistent dependency cache
+        workers: Number of worker processes (default: one per CPU)
+        chunksize: Texts sent to a worker at a time
+
+    Returns:
+        List of entity dictionaries, in the same order as texts
+    """
+    extract = partial(
+        extract_entities_hybrid_batch,
+        use_morphology=use_morphology,
+        use_dependencies=use_dependencies,
+        min_confidence=min_confidence,
+        verbose=verbose,
+        parse_cache_dir=parse_cache_dir
+    )
+
+    results = []
+    for _, chunk_results in iter_batch_results(
+        extract, texts, workers, chunksize,
+        preload=preload_cltk, preload_args=(use_morphology, use_dependencies)
+    ):
+        results.extend(chunk_results)
+    return results
@@ -7,7 +7,66 @@ when names are unknown.
 """
 
 import re
-from typing import Dict, Any, List, Tuple, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, NamedTuple, Tuple, Optional
+
+
+# Text normalization patterns
+_BR_RE = re.compile(r'<BR/?>')
+_WS_RE = re.compile(r'\s+')
+
+# Any letter; texts without one (e.g. only sigla or lacunae) are not analyzed
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+# Verbs that mark nominative subjects as dedicators; like the dependency
+# rules, they match as substrings of the uppercased text
+_DEDICATION_VERB_RE = re.compile(
+    'FECIT|FECERUNT|POSUIT|POSUERUNT|CURAVIT|CURAVERUNT'
+)
+
+# Dative relationship lemmas mapped to (relationship, confidence)
+_RELATIONSHIP_LEMMAS = {
+    'pater': ('father', 0.92),
+    'mater': ('mother', 0.92),
+    'filius': ('son', 0.92),
+    'filia': ('daughter', 0.92),
+    'coniunx': ('spouse', 0.90),
+    'uxor': ('wife', 0.90),
+    'maritus': ('husband', 0.90),
+    'frater': ('brother', 0.88),
+    'soror': ('sister', 0.88),
+    'avus': ('grandfather', 0.88),
+    'avia': ('grandmother', 0.88),
+    'nepos': ('grandson', 0.88),
+    'neptis': ('granddaughter', 0.88),
+    'heres': ('heir', 0.90),
+}
+
+
+class _WordColumns(NamedTuple):
+    """Parallel per-word attribute lists read once from CLTK words."""
+    strings: List[Optional[str]]
+    lemmas: List[Optional[str]]
+    pos: List[Optional[str]]
+    cases: List[Optional[str]]
+
+
+def _to_columns(words: List[Any]) -> _WordColumns:
+    """
+    Read the attributes used by the morphology rules from each word once.
+
+    Missing attributes become None, and words without features get no case,
+    so the rules can test values directly instead of probing with hasattr.
+    """
+    strings, lemmas, pos, cases = [], [], [], []
+    for word in words:
+        strings.append(getattr(word, 'string', None))
+        lemmas.append(getattr(word, 'lemma', None))
+        pos.append(getattr(word, 'pos', None))
+        features = getattr(word, 'features', None)
+        cases.append(features.case if features else None)
+    return _WordColumns(strings, lemmas, pos, cases)
 
 
 class LatinMorphologyAnalyzer:
@@ -21,47 +80,98 @@ class LatinMorphologyAnalyzer:
     - Proper nouns vs common nouns
     """
 
-    def __init__(self):
-        """Initialize the CLTK analyzer."""
+    def __init__(self, cache_size: int = 512):
+        """
+        Initialize the CLTK analyzer.
+
+        Args:
+            cache_size: Number of normalized texts whose analyses are kept in
+                an LRU cache (0 disables caching)
+        """
         self._nlp = None
         self._initialized = False
+        self._init_lock = threading.Lock()
+        self._warm_up_thread = None
+        self._cache_size = cache_size
+        self._analysis_cache = OrderedDict()
 
     def _ensure_initialized(self):
         """Lazy initialization of CLTK to avoid startup overhead."""
         if self._initialized:
             return
 
-        try:
-            from cltk import NLP
-            self._nlp = NLP(language="lat", suppress_banner=True)
-            self._initialized = True
-        except ImportError:
-            raise ImportError(
-                "CLTK is required for morphological analysis. "
-                "Install with: pip install cltk"
+        # Threads warming up the pipeline must not load the models twice
+        with self._init_lock:
+            if self._initialized:
+                return
+            try:
+                from cltk import NLP
+                self._nlp = NLP(language="lat", suppress_banner=True)
+                self._initialized = True
+            except ImportError:
+                raise ImportError(
+                    "CLTK is required for morphological analysis. "
+                    "Install with: pip install cltk"
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to initialize CLTK: {e}")
+
+    def warm_up(self):
+        """
+        Start loading the CLTK pipeline in a background thread.
+
+        Only one warm-up thread is started per instance. Errors are left
+        for the first real call to report.
+        """
+        with self._init_lock:
+            if self._initialized or self._warm_up_thread is not None:
+                return
+            self._warm_up_thread = threading.Thread(
+                target=self._warm_up, daemon=True
             )
-        except Exception as e:
-            raise RuntimeError(f"Failed to initialize CLTK: {e}")
+            self._warm_up_thread.start()
+
+    def _warm_up(self):
+        """Initialize CLTK, ignoring failures."""
+        try:
+            self._ensure_initialized()
+        except (ImportError, RuntimeError):
+            pass
+
+    def wait_for_warm_up(self):
+        """Block until a warm-up started by warm_up has finished."""
+        thread = self._warm_up_thread
+        if thread is not None:
+            thread.join()
 
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
         Analyze inscription text using morphological features.
 
+        Analyses are cached by normalized text, so repeated calls on the
+        same inscription only run the CLTK pipeline once.
+
         Args:
             text: The inscription text to analyze
 
         Returns:
             Dictionary containing morphological analysis results
         """
-        self._ensure_initialized()
+        normalized_text = self._normalize(text)
 
-        # Normalize text for CLTK
-        normalized_text = text.replace('<BR>', ' ').replace('<BR/>', ' ')
-        normalized_text = re.sub(r'\s+', ' ', normalized_text.strip())
+        if not _LETTER_RE.search(normalized_text):
+            return {'words': [], 'sentences': [], 'raw': None}
+
+        # Report mode and validation analyze the same text repeatedly
+        analysis = self._cache_get(normalized_text)
+        if analysis is not None:
+            return analysis
+
+        self._ensure_initialized()
 
         try:
             doc = self._nlp.analyze(text=normalized_text)
-            return {
+            analysis = {
                 'words': doc.words,
                 'sentences': doc.sentences,
                 'raw': doc
@@ -74,7 +184,34 @@ class LatinMorphologyAnalyzer:
                 'error': str(e)
             }
 
-    def extract_entities_by_morphology(self, text: str) -> Dict[str, Dict[str, Any]]:
+        self._cache_put(normalized_text, analysis)
+        return analysis
+
+    def _normalize(self, text: str) -> str:
+        """Normalize line breaks and whitespace before analysis."""
+        return _WS_RE.sub(' ', _BR_RE.sub(' ', text)).strip()
+
+    def _cache_get(self, normalized_text: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached analysis, marking the entry as recently used."""
+        analysis = self._analysis_cache.get(normalized_text)
+        if analysis is not None:
+            self._analysis_cache.move_to_end(normalized_text)
+        return analysis
+
+    def _cache_put(self, normalized_text: str, analysis: Dict[str, Any]):
+        """Store an analysis, evicting the least recently used entry when full."""
+        if self._cache_size <= 0:
+            return
+        self._analysis_cache[normalized_text] = analysis
+        self._analysis_cache.move_to_end(normalized_text)
+        while len(self._analysis_cache) > self._cache_size:
+            self._analysis_cache.popitem(last=False)
+
+    def extract_entities_by_morphology(
+        self,
+        text: str,
+        text_upper: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Extract entities based on morphological analysis.
 
@@ -86,27 +223,64 @@ class LatinMorphologyAnalyzer:
 
         Args:
             text: The inscription text to analyze
+            text_upper: text.upper(), if the caller already has it
 
         Returns:
             Dictionary of extracted entities with confidence scores
         """
+        if text_upper is None:
+            text_upper = text.upper()
+        return self._entities_from_analysis(self.analyze_text(text), text_upper)
+
+    def extract_entities_by_morphology_batch(
+        self,
+        texts: List[str]
+    ) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Extract entities for a batch of texts using morphological analysis.
+
+        CLTK analyzes one document per call, and inscriptions carry no
+        sentence punctuation to split a joined document back apart, so each
+        distinct normalized text is analyzed once and shared across the batch.
+
+        Args:
+            texts: The inscription texts to analyze
+
+        Returns:
+            List of entity dictionaries, in the same order as texts
+        """
+        analyses = {}
+        results = []
+        for text in texts:
+            normalized_text = self._normalize(text)
+            analysis = analyses.get(normalized_text)
+            if analysis is None:
+                analysis = analyses[normalized_text] = self.analyze_text(text)
+            results.append(self._entities_from_analysis(analysis, text.upper()))
+        return results
+
+    def _entities_from_analysis(
+        self,
+        analysis: Dict[str, Any],
+        text_upper: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Apply the morphological extraction rules to an analysis."""
         entities = {}
-        analysis = self.analyze_text(text)
 
         if 'error' in analysis or not analysis['words']:
             return entities
 
-        words = analysis['words']
+        columns = _to_columns(analysis['words'])
 
         # Extract entities using morphological rules
-        entities.update(self._extract_genitive_proper_nouns(words))
-        entities.update(self._extract_nominative_subjects(words, text))
-        entities.update(self._extract_dative_relationships(words))
-        entities.update(self._extract_ablative_locations(words))
+        entities.update(self._extract_genitive_proper_nouns(columns))
+        entities.update(self._extract_nominative_subjects(columns, text_upper))
+        entities.update(self._extract_dative_relationships(columns))
+        entities.update(self._extract_ablative_locations(columns))
 
         return entities
 
-    def _extract_genitive_proper_nouns(self, words: List[Any]) -> Dict[str, Dict[str, Any]]:
+    def _extract_genitive_proper_nouns(self, columns: _WordColumns) -> Dict[str, Dict[str, Any]]:
         """
         Extract genitive proper nouns (likely deceased persons).
 
@@ -114,21 +288,13 @@ class LatinMorphologyAnalyzer:
         In inscriptions, genitive proper nouns usually refer to the deceased.
         """
         entities = {}
-        genitive_names = []
-
-        for word in words:
-            # Check if word has morphological features
-            if not hasattr(word, 'features') or not word.features:
-                continue
 
-            features = word.features
-
-            # Look for genitive case proper nouns
-            if (features.case == 'Gen' and
-                hasattr(word, 'pos') and word.pos in ['PROPN', 'NOUN']):
-
-                # Store genitive name
-                genitive_names.append(word.string)
+        # Look for genitive case proper nouns
+        genitive_names = [
+            string
+            for string, case, pos in zip(columns.strings, columns.cases, columns.pos)
+            if case == 'Gen' and pos in ('PROPN', 'NOUN')
+        ]
 
         # If we found genitive proper nouns, combine them
         if genitive_names:
@@ -142,7 +308,7 @@ class LatinMorphologyAnalyzer:
 
         return entities
 
-    def _extract_nominative_subjects(self, words: List[Any], text: str) -> Dict[str, Dict[str, Any]]:
+    def _extract_nominative_subjects(self, columns: _WordColumns, text_upper: str) -> Dict[str, Dict[str, Any]]:
         """
         Extract nominative subjects (likely dedicators if before FECIT).
 
@@ -150,32 +316,19 @@ class LatinMorphologyAnalyzer:
         proper nouns before FECIT/POSUIT are the dedicators.
         """
         entities = {}
-        nominative_names = []
-        found_dedication_verb = False
 
         # Check if text contains dedication verbs
-        dedication_verbs = ['FECIT', 'FECERUNT', 'POSUIT', 'POSUERUNT',
-                           'CURAVIT', 'CURAVERUNT']
-        text_upper = text.upper()
-        for verb in dedication_verbs:
-            if verb in text_upper:
-                found_dedication_verb = True
-                break
+        found_dedication_verb = _DEDICATION_VERB_RE.search(text_upper) is not None
 
         if not found_dedication_verb:
             return entities
 
-        for word in words:
-            if not hasattr(word, 'features') or not word.features:
-                continue
-
-            features = word.features
-
-            # Look for nominative case proper nouns
-            if (features.case == 'Nom' and
-                hasattr(word, 'pos') and word.pos in ['PROPN', 'NOUN']):
-
-                nominative_names.append(word.string)
+        # Look for nominative case proper nouns
+        nominative_names = [
+            string
+            for string, case, pos in zip(columns.strings, columns.cases, columns.pos)
+            if case == 'Nom' and pos in ('PROPN', 'NOUN')
+        ]
 
         # If we found nominative proper nouns and a dedication verb
         if nominative_names and found_dedication_verb:
@@ -189,7 +342,7 @@ class LatinMorphologyAnalyzer:
 
         return entities
 
-    def _extract_dative_relationships(self, words: List[Any]) -> Dict[str, Dict[str, Any]]:
+    def _extract_dative_relationships(self, columns: _WordColumns) -> Dict[str, Dict[str, Any]]:
         """
         Extract dative relationship words.
 
@@ -198,49 +351,24 @@ class LatinMorphologyAnalyzer:
         """
         entities = {}
 
-        # Map lemmas to relationship values
-        relationship_lemmas = {
-            'pater': ('father', 0.92),
-            'mater': ('mother', 0.92),
-            'filius': ('son', 0.92),
-            'filia': ('daughter', 0.92),
-            'coniunx': ('spouse', 0.90),
-            'uxor': ('wife', 0.90),
-            'maritus': ('husband', 0.90),
-            'frater': ('brother', 0.88),
-            'soror': ('sister', 0.88),
-            'avus': ('grandfather', 0.88),
-            'avia': ('grandmother', 0.88),
-            'nepos': ('grandson', 0.88),
-            'neptis': ('granddaughter', 0.88),
-            'heres': ('heir', 0.90),
-        }
-
-        for word in words:
-            if not hasattr(word, 'features') or not word.features:
-                continue
-
-            features = word.features
-
-            # Look for dative case
-            if features.case == 'Dat':
-                # Check if lemma matches known relationships
-                if hasattr(word, 'lemma') and word.lemma:
-                    lemma = word.lemma.lower()
-                    if lemma in relationship_lemmas:
-                        rel_value, confidence = relationship_lemmas[lemma]
-                        entities['relationship_morphology'] = {
-                            'value': rel_value,
-                            'confidence': confidence,
-                            'source': 'morphology',
-                            'case': 'dative',
-                            'lemma': lemma
-                        }
-                        break
+        for case, lemma in zip(columns.cases, columns.lemmas):
+            # Look for dative case with a known relationship lemma
+            if case == 'Dat' and lemma:
+                lemma = lemma.lower()
+                if lemma in _RELATIONSHIP_LEMMAS:
+                    rel_value, confidence = _RELATIONSHIP_LEMMAS[lemma]
+                    entities['relationship_morphology'] = {
+                        'value': rel_value,
+                        'confidence': confidence,
+                        'source': 'morphology',
+                        'case': 'dative',
+                        'lemma': lemma
+                    }
+                    break
 
         return entities
 
-    def _extract_ablative_locations(self, words: List[Any]) -> Dict[str, Dict[str, Any]]:
+    def _extract_ablative_locations(self, columns: _WordColumns) -> Dict[str, Dict[str, Any]]:
         """
         Extract ablative locations.
 
@@ -248,19 +376,13 @@ class LatinMorphologyAnalyzer:
         Often used for place names in inscriptions.
         """
         entities = {}
-        ablative_places = []
-
-        for word in words:
-            if not hasattr(word, 'features') or not word.features:
-                continue
 
-            features = word.features
-
-            # Look for ablative case proper nouns (places)
-            if (features.case == 'Abl' and
-                hasattr(word, 'pos') and word.pos == 'PROPN'):
-
-                ablative_places.append(word.string)
+        # Look for ablative case proper nouns (places)
+        ablative_places = [
+            string
+            for string, case, pos in zip(columns.strings, columns.cases, columns.pos)
+            if case == 'Abl' and pos == 'PROPN'
+        ]
 
         if ablative_places:
             location = ' '.join(ablative_places)
@@ -327,16 +449,16 @@ class LatinMorphologyAnalyzer:
             return (False, 0.0)
 
         # Check if any word matches expected case
-        for word in analysis['words']:
-            if not hasattr(word, 'features') or not word.features:
-                continue
-
-            if word.features.case == expected_case:
-                return (True, 0.10)  # Boost confidence by 10%
+        if expected_case in _to_columns(analysis['words']).cases:
+            return (True, 0.10)  # Boost confidence by 10%
 
         return (False, -0.10)  # Reduce confidence by 10%
 
 
+# Shared instance returned by get_morphology_analyzer
+_MORPHOLOGY_ANALYZER: Optional[LatinMorphologyAnalyzer] = None
+
+
 def get_morphology_analyzer() -> LatinMorphologyAnalyzer:
     """
     Get a singleton instance of the morphology analyzer.
@@ -344,6 +466,6 @@ def get_morphology_analyzer() -> LatinMorphologyAnalyzer:
     This avoids reloading CLTK models multiple times.
     """
     global _MORPHOLOGY_ANALYZER
-    if '_MORPHOLOGY_ANALYZER' not in globals():
+    if _MORPHOLOGY_ANALYZER is None:
         _MORPHOLOGY_ANALYZER = LatinMorphologyAnalyzer()
     return _MORPHOLOGY_ANALYZER
@@ -0,0 +1,75 @@
+"""
+Batch processing across worker processes for large inscription corpora.
+"""
+import os
+from collections import deque
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+def iter_batch_results(
+    func: Callable[[List[Any]], Any],
+    items: Iterable[Any],
+    workers: Optional[int] = None,
+    batch_size: int = 64,
+    preload: Optional[Callable[..., None]] = None,
+    preload_args: Tuple[Any, ...] = ()
+) -> Iterator[Tuple[List[Any], Any]]:
+    """
+    Yield (batch, func(batch)) for consecutive batches of items, in input order.
+
+    With more than one worker and more than one batch, batches are run in a
+    process pool, keeping at most two batches per worker in flight, so items
+    may be a lazy iterator and memory stays bounded. Otherwise everything
+    runs in this process.
+
+    Args:
+        func: Module-level function applied to each batch (sent to workers)
+        items: The items to process
+        workers: Number of worker processes (default: one per CPU)
+        batch_size: Items per batch
+        preload: Function run in each worker before its first batch. Where
+            fork is available it is run once here instead, so workers
+            inherit what it loaded (such as CLTK models) copy-on-write.
+        preload_args: Arguments for preload
+    """
+    items = iter(items)
+    batches = iter(lambda: list(islice(items, batch_size)), [])
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1:
+        head = list(islice(batches, 2))
+        if len(head) == 2:
+            yield from _iter_pool_results(
+                func, chain(head, batches), workers, preload, preload_args
+            )
+            return
+        batches = iter(head)
+
+    for batch in batches:
+        yield batch, func(batch)
+
+
+def _iter_pool_results(func, batches, workers, preload, preload_args):
+    """Run batches in a process pool, yielding results in input order."""
+    # Imported here: the process pool machinery roughly doubles module import time
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    mp_context = None
+    if preload is not None and 'fork' in multiprocessing.get_all_start_methods():
+        preload(*preload_args)
+        mp_context = multiprocessing.get_context('fork')
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                             initializer=preload, initargs=preload_args) as executor:
+        in_flight = deque()
+        for batch in batches:
+            in_flight.append((batch, executor.submit(func, batch)))
+            if len(in_flight) >= workers * 2:
+                done_batch, future = in_flight.popleft()
+                yield done_batch, future.result()
+        while in_flight:
+            done_batch, future = in_flight.popleft()
+            yield done_batch, future.result()
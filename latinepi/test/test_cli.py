@@ -26,6 +26,18 @@ class TestCLI(unittest.TestCase):
         if self.temp_path.exists():
             shutil.rmtree(self.temp_path)
 
+    def test_import_defers_edh_and_hybrid_modules(self):
+        """Test that importing the CLI does not load the EDH client or hybrid parser."""
+        result = subprocess.run(
+            [sys.executable, '-c',
+             'import sys, latinepi.cli; '
+             'print(sorted(m for m in ("requests", "latinepi.edh_utils", '
+             '"latinepi.hybrid_parser") if m in sys.modules))'],
+            capture_output=True,
+            text=True
+        )
+        self.assertEqual(result.stdout.strip(), '[]')
+
     def test_help_flag(self):
         """Test that running with --help prints usage message."""
         result = subprocess.run(
@@ -214,6 +226,49 @@ class TestCLI(unittest.TestCase):
         self.assertGreaterEqual(first['praenomen_confidence'], 0.0)
         self.assertLessEqual(first['praenomen_confidence'], 1.0)
 
+    def test_parallel_workers_match_serial_output(self):
+        """Test that --workers produces the same output as a serial run."""
+        input_path = self.temp_path / "inscriptions.json"
+        input_data = [
+            {"id": i, "text": text}
+            for i, text in enumerate([
+                "D M GAIVS IVLIVS CAESAR",
+                "MARCVS ANTONIVS",
+                "D M MARCIA TVRPILIA",
+            ] * 50, start=1)
+        ]
+        input_path.write_text(json.dumps(input_data))
+
+        outputs = []
+        for workers in ('1', '2'):
+            output_path = self.temp_path / f"entities_{workers}.json"
+            result = subprocess.run(
+                [sys.executable, str(self.cli_path),
+                 '--input', str(input_path),
+                 '--output', str(output_path),
+                 '--workers', workers],
+                capture_output=True,
+                text=True
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn('Processed inscription 150/150', result.stdout)
+            outputs.append(output_path.read_text())
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_negative_workers_rejected(self):
+        """Test that a negative --workers value is rejected."""
+        result = subprocess.run(
+            [sys.executable, str(self.cli_path),
+             '--input', 'test.json',
+             '--output', 'out.json',
+             '--workers', '-1'],
+            capture_output=True,
+            text=True
+        )
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn('--workers must be 0 or greater', result.stderr)
+
     def test_confidence_threshold_default(self):
         """Test that default confidence threshold (0.5) filters entities correctly."""
         # Create input with text that will produce mixed confidence entities
@@ -537,5 +592,140 @@ class TestCLI(unittest.TestCase):
         self.assertIn('Either --download-edh, --search-edh, or --input must be specified', result.stderr)
 
 
+class TestInscriptionText(unittest.TestCase):
+    """Test cases for locating the text field of an inscription."""
+
+    def test_text_field_preference(self):
+        """Test that text fields are tried in order and missing ones skipped."""
+        from latinepi.cli import get_inscription_text
+
+        self.assertEqual(get_inscription_text({'text': 'A', 'Text': 'B'}), 'A')
+        self.assertEqual(get_inscription_text({'Text': 'B'}), 'B')
+        self.assertEqual(get_inscription_text({'transcription': 'C'}), 'C')
+        self.assertEqual(get_inscription_text({'text': '', 'Text': 'B'}), '')
+        self.assertEqual(get_inscription_text({'id': 1}), '')
+
+
+class TestResultWriters(unittest.TestCase):
+    """Test cases for the streaming result writers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        self.results = [
+            {'inscription_id': 1, 'nomen': 'Iulius', 'nomen_confidence': 0.88},
+            {'inscription_id': 2, 'status': 'dis manibus', 'status_ambiguous': True},
+        ]
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_json_writer_matches_json_dump(self):
+        """Test that streamed JSON is identical to json.dump with indent=2."""
+        from latinepi.cli import JsonResultWriter
+
+        for results in (self.results, []):
+            output_path = self.temp_path / "output.json"
+            writer = JsonResultWriter(output_path)
+            for result in results:
+                writer.write(result)
+            writer.close()
+
+            self.assertEqual(
+                output_path.read_text(encoding='utf-8'),
+                json.dumps(results, indent=2, ensure_ascii=False)
+            )
+            self.assertEqual(writer.count, len(results))
+
+    def test_dumps_result_without_orjson(self):
+        """Test that the standard library fallback produces the same text."""
+        from unittest.mock import patch
+        import latinepi.cli as cli
+
+        record = {'inscription_id': 1, 'nomen': 'Iūlius', 'nomen_confidence': 0.88,
+                  'status_ambiguous': True}
+        expected = json.dumps(record, indent=2, ensure_ascii=False)
+
+        self.assertEqual(cli.dumps_result(record, indent=True), expected)
+        with patch.object(cli, 'orjson', None):
+            self.assertEqual(cli.dumps_result(record, indent=True), expected)
+            self.assertEqual(json.loads(cli.dumps_result(record)), record)
+
+    def test_dumps_result_matches_json_for_unusual_values(self):
+        """Test that values orjson formats differently still match json.dumps."""
+        import latinepi.cli as cli
+
+        for record in (
+            {'confidence': 1e-07, 'big': 1e16},
+            {'score': float('nan')},
+            {'count': 2 ** 70},
+            {1: 'non-str key'},
+            {'nested': {'confidence': 0.88}},
+            {'text': 'lone \ud800 surrogate'},
+        ):
+            self.assertEqual(
+                cli.dumps_result(record, indent=True),
+                json.dumps(record, indent=2, ensure_ascii=False)
+            )
+            self.assertEqual(
+                cli.dumps_result(record),
+                json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+            )
+
+    def test_csv_writer_collects_all_fieldnames(self):
+        """Test that the CSV header covers fields from every record."""
+        import csv
+        from latinepi.cli import CsvResultWriter
+
+        output_path = self.temp_path / "output.csv"
+        writer = CsvResultWriter(output_path)
+        for result in self.results:
+            writer.write(result)
+        writer.close()
+
+        with open(output_path, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual(
+            list(rows[0].keys()),
+            ['inscription_id', 'nomen', 'nomen_confidence',
+             'status', 'status_ambiguous']
+        )
+        self.assertEqual(rows[0]['nomen'], 'Iulius')
+        self.assertEqual(rows[1]['status_ambiguous'], 'True')
+        self.assertEqual(rows[1]['nomen'], '')
+
+    def test_csv_writer_matches_dictwriter_for_any_values(self):
+        """Test that values JSON cannot represent are written as DictWriter would."""
+        import csv
+        import io
+        from datetime import date
+        from decimal import Decimal
+        from latinepi.cli import CsvResultWriter
+
+        results = [
+            {'inscription_id': 1, 'dated': date(2020, 1, 2), 'amount': Decimal('1.50')},
+            {'inscription_id': 2, 'pair': (1, 2), 'confidence': 1e-07},
+        ]
+        output_path = self.temp_path / "output.csv"
+        writer = CsvResultWriter(output_path)
+        for result in results:
+            writer.write(result)
+        writer.close()
+
+        expected = io.StringIO(newline='')
+        dict_writer = csv.DictWriter(
+            expected, fieldnames=['inscription_id', 'amount', 'confidence', 'dated', 'pair']
+        )
+        dict_writer.writeheader()
+        dict_writer.writerows(results)
+
+        with open(output_path, 'r', encoding='utf-8', newline='') as f:
+            self.assertEqual(f.read(), expected.getvalue())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,246 @@
+"""
+Tests for the dependency parser that do not require CLTK.
+"""
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from latinepi.dependency import LatinDependencyParser, _scan_keywords
+
+
+def _parser_with_doc(words, cache_size=4096, cache_dir=None):
+    """Build a parser whose CLTK pipeline returns a fixed document."""
+    parser = LatinDependencyParser(cache_size=cache_size, cache_dir=cache_dir)
+    parser._nlp = Mock()
+    parser._nlp.analyze.return_value = SimpleNamespace(words=words, sentences=[])
+    parser._initialized = True
+    return parser
+
+
+class TestDependencyCache(unittest.TestCase):
+    """Test cases for the dependency entity cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.words = [
+            SimpleNamespace(string='VIBIA', lemma='Vibia', pos='PROPN',
+                            dependency_relation='nmod',
+                            features={'Case': 'Gen'}),
+        ]
+
+    def test_repeated_text_parsed_once(self):
+        """Test that identical normalized texts only run CLTK once."""
+        parser = _parser_with_doc(self.words)
+
+        first = parser.extract_entities_by_dependencies("D M VIBIAE")
+        second = parser.extract_entities_by_dependencies("D  M<BR>VIBIAE")
+
+        self.assertEqual(first, second)
+        self.assertEqual(parser._nlp.analyze.call_count, 1)
+
+    def test_cached_entities_are_copies(self):
+        """Test that mutating returned entities does not alter the cache."""
+        parser = _parser_with_doc(self.words)
+
+        first = parser.extract_entities_by_dependencies("D M VIBIAE")
+        for value in first.values():
+            value['extraction_phase'] = 'dependencies'
+        second = parser.extract_entities_by_dependencies("D M VIBIAE")
+
+        for value in second.values():
+            self.assertNotIn('extraction_phase', value)
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache is bounded by cache_size."""
+        parser = _parser_with_doc(self.words, cache_size=2)
+
+        parser.extract_entities_by_dependencies_batch(["A", "B", "C"])
+        parser.extract_entities_by_dependencies("A")
+
+        self.assertEqual(parser._nlp.analyze.call_count, 4)
+        self.assertEqual(list(parser._entity_cache), ["C", "A"])
+
+    def test_batch_parses_duplicates_once(self):
+        """Test that duplicate texts within a batch share one parse."""
+        parser = _parser_with_doc(self.words)
+
+        results = parser.extract_entities_by_dependencies_batch(["A", "B", "A"])
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(parser._nlp.analyze.call_count, 2)
+
+    def test_report_views_share_last_parse(self):
+        """Test that the tree and structure of one text come from one parse."""
+        parser = _parser_with_doc(self.words)
+
+        tree = parser.get_dependency_tree("D M VIBIAE")
+        structure = parser.analyze_inscription_structure("D M<BR>VIBIAE")
+        parser.get_dependency_tree("D M SABINAE")
+
+        self.assertEqual(tree[0]['word'], 'VIBIA')
+        self.assertTrue(structure['has_genitive'])
+        self.assertEqual(parser._nlp.analyze.call_count, 2)
+
+    def test_text_without_letters_skips_cltk(self):
+        """Test that texts with no letters never initialize CLTK."""
+        parser = LatinDependencyParser()
+
+        self.assertEqual(parser.extract_entities_by_dependencies("[---] 3 <BR>"), {})
+        self.assertEqual(parser.parse_dependencies(" - ")['words'], [])
+        self.assertFalse(parser._initialized)
+
+    def test_cache_disabled(self):
+        """Test that cache_size=0 disables caching."""
+        parser = _parser_with_doc(self.words, cache_size=0)
+
+        parser.extract_entities_by_dependencies("D M VIBIAE")
+        parser.extract_entities_by_dependencies("D M VIBIAE")
+
+        self.assertEqual(parser._nlp.analyze.call_count, 2)
+
+
+class TestDependencyDiskCache(unittest.TestCase):
+    """Test cases for the persistent dependency cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.words = [
+            SimpleNamespace(string='SABINAE', dependency_relation='nmod',
+                            features={'Case': 'Gen'}),
+        ]
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_entities_reused_across_parser_instances(self):
+        """Test that a second parser reads results written by the first."""
+        first = _parser_with_doc(self.words, cache_dir=self.temp_dir)
+        expected = first.extract_entities_by_dependencies("D M SABINAE")
+
+        second = _parser_with_doc([], cache_dir=self.temp_dir)
+        entities = second.extract_entities_by_dependencies("D M SABINAE")
+
+        self.assertEqual(entities, expected)
+        self.assertEqual(second._nlp.analyze.call_count, 0)
+        self.assertEqual(len(list(Path(self.temp_dir).rglob('*.json'))), 1)
+
+    def test_corrupt_entry_is_reparsed(self):
+        """Test that an unreadable cache entry falls back to parsing."""
+        parser = _parser_with_doc(self.words, cache_dir=self.temp_dir)
+        path = parser._disk_cache_path(Path(self.temp_dir), "D M SABINAE")
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        entities = parser.extract_entities_by_dependencies("D M SABINAE")
+
+        self.assertIn('deceased_name_dependency', entities)
+        self.assertEqual(parser._nlp.analyze.call_count, 1)
+
+    def test_failed_parse_not_cached(self):
+        """Test that a CLTK failure is retried rather than cached in memory or on disk."""
+        parser = _parser_with_doc(self.words, cache_dir=self.temp_dir)
+        parser._nlp.analyze.side_effect = RuntimeError("tagger failed")
+
+        self.assertEqual(parser.extract_entities_by_dependencies("D M SABINAE"), {})
+        self.assertEqual(list(Path(self.temp_dir).rglob('*.json')), [])
+
+        parser._nlp.analyze.side_effect = None
+        entities = parser.extract_entities_by_dependencies("D M SABINAE")
+
+        self.assertIn('deceased_name_dependency', entities)
+        self.assertEqual(parser._nlp.analyze.call_count, 2)
+
+    def test_cache_dir_per_call(self):
+        """Test that a cache_dir passed to one call does not stick to the parser."""
+        parser = _parser_with_doc(self.words, cache_size=0)
+
+        parser.extract_entities_by_dependencies("D M SABINAE", cache_dir=self.temp_dir)
+        parser.extract_entities_by_dependencies("D M SABINAE")
+
+        self.assertIsNone(parser.cache_dir)
+        self.assertEqual(len(list(Path(self.temp_dir).rglob('*.json'))), 1)
+        self.assertEqual(parser._nlp.analyze.call_count, 2)
+
+
+class TestDependencyRules(unittest.TestCase):
+    """Test cases for text-level checks in the dependency rules."""
+
+    def test_normalize_collapses_breaks_and_whitespace(self):
+        """Test that <BR> markers and runs of whitespace become single spaces."""
+        parser = LatinDependencyParser()
+        self.assertEqual(
+            parser._normalize("  D M<BR>GAIVS<BR/>  IVLIVS  "),
+            "D M GAIVS IVLIVS"
+        )
+
+    def test_scan_keywords_single_pass(self):
+        """Test that verbs and ET are found in one scan with first positions."""
+        found = _scan_keywords("PATER ET MATER POSUERUNT REFECIT FECIT")
+
+        self.assertEqual(found['ET'], 6)
+        self.assertIn('POSUERUNT', found)
+        # Verbs match as substrings, so REFECIT counts as FECIT
+        self.assertEqual(found['FECIT'], 27)
+
+    def test_scan_keywords_et_needs_spaces(self):
+        """Test that ET is only matched as a space-delimited word."""
+        self.assertNotIn('ET', _scan_keywords("ET PATER MATER ET"))
+        self.assertNotIn('ET', _scan_keywords("METELLUS SECUNDUS"))
+
+    def test_dedicator_relation_names_verb(self):
+        """Test that the dedicator relation records the dedication verb found."""
+        words = [
+            SimpleNamespace(string='PAULUS', lemma='Paulus', pos='PROPN',
+                            dependency_relation='nsubj', features={}),
+            SimpleNamespace(string='POSUIT', lemma='pono', pos='VERB',
+                            dependency_relation='root', features={}),
+        ]
+        parser = _parser_with_doc(words)
+
+        entities = parser.extract_entities_by_dependencies("PAULUS POSUIT")
+
+        self.assertEqual(entities['dedicator_dependency']['value'], 'PAULUS')
+        self.assertEqual(
+            entities['dedicator_dependency']['relation'], 'subject_of_posuit'
+        )
+
+    def test_verb_precedence_follows_verb_list(self):
+        """Test that FECIT is preferred over POSUIT wherever each appears."""
+        words = [
+            SimpleNamespace(string='PAULUS', lemma='Paulus', pos='PROPN',
+                            dependency_relation='nsubj', features={}),
+        ]
+        parser = _parser_with_doc(words)
+
+        entities = parser.extract_entities_by_dependencies("PAULUS POSUIT ET FECIT")
+        analysis = parser.analyze_inscription_structure("PAULUS POSUIT ET FECIT")
+
+        self.assertEqual(
+            entities['dedicator_dependency']['relation'], 'subject_of_fecit'
+        )
+        self.assertEqual(analysis['main_verb'], 'FECIT')
+
+    def test_words_with_missing_attributes(self):
+        """Test that words lacking optional attributes are skipped, not fatal."""
+        words = [
+            SimpleNamespace(string='ET'),
+            SimpleNamespace(string='TERTULLA', pos='PROPN',
+                            dependency_relation='conj', features=None),
+            SimpleNamespace(string='SABINAE', dependency_relation='nmod',
+                            features={'Case': 'Gen'}),
+        ]
+        parser = _parser_with_doc(words)
+
+        entities = parser.extract_entities_by_dependencies("PAULUS ET TERTULLA SABINAE")
+
+        self.assertEqual(entities['coordinated_dedicators']['value'], 'TERTULLA')
+        self.assertEqual(entities['deceased_name_dependency']['value'], 'SABINAE')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,17 +2,24 @@
 Tests for EDH download utility.
 """
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch, Mock
 
 try:
-    from latinepi.edh_utils import download_edh_inscription, EDH_API_BASE
+    from latinepi import edh_utils
+    from latinepi.edh_utils import (
+        download_edh_inscription, search_edh_inscriptions, EDH_API_BASE
+    )
 except ModuleNotFoundError:
     import sys
     sys.path.insert(0, str(Path(__file__).parent.parent))
-    from edh_utils import download_edh_inscription, EDH_API_BASE
+    import edh_utils
+    from edh_utils import (
+        download_edh_inscription, search_edh_inscriptions, EDH_API_BASE
+    )
 
 
 class TestEDHUtils(unittest.TestCase):
@@ -41,7 +48,7 @@ class TestEDHUtils(unittest.TestCase):
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    @patch('requests.get')
+    @patch.object(edh_utils._SESSION, 'get')
     def test_download_inscription_success(self, mock_get):
         """Test successful download of an inscription."""
         # Mock successful API response
@@ -68,7 +75,7 @@ class TestEDHUtils(unittest.TestCase):
             data = json.load(f)
         self.assertEqual(data, self.sample_response)
 
-    @patch('requests.get')
+    @patch.object(edh_utils._SESSION, 'get')
     def test_download_with_numeric_id(self, mock_get):
         """Test downloading with numeric ID (should add HD prefix)."""
         mock_response = Mock()
@@ -88,7 +95,7 @@ class TestEDHUtils(unittest.TestCase):
         # Verify file name has HD prefix
         self.assertTrue(output_file.endswith("HD000123.json"))
 
-    @patch('requests.get')
+    @patch.object(edh_utils._SESSION, 'get')
     def test_download_creates_directory(self, mock_get):
         """Test that download creates output directory if it doesn't exist."""
         mock_response = Mock()
@@ -120,7 +127,7 @@ class TestEDHUtils(unittest.TestCase):
 
         self.assertIn("Invalid inscription ID format", str(cm.exception))
 
-    @patch('requests.get')
+    @patch.object(edh_utils._SESSION, 'get')
     def test_download_http_404_raises_error(self, mock_get):
         """Test that HTTP 404 raises error."""
         mock_response = Mock()
@@ -131,7 +138,7 @@ class TestEDHUtils(unittest.TestCase):
         with self.assertRaises(Exception):
             download_edh_inscription("HD999999", self.temp_dir)
 
-    @patch('requests.get')
+    @patch.object(edh_utils._SESSION, 'get')
     def test_download_connection_error(self, mock_get):
         """Test that connection error is handled."""
         import requests
@@ -142,7 +149,7 @@ class TestEDHUtils(unittest.TestCase):
 
         self.assertIn("Connection error", str(cm.exception))
 
-    @patch('requests.get')
+    @patch.object(edh_utils._SESSION, 'get')
     def test_download_timeout_error(self, mock_get):
         """Test that timeout error is handled."""
         import requests
@@ -153,7 +160,7 @@ class TestEDHUtils(unittest.TestCase):
 
         self.assertIn("timed out", str(cm.exception))
 
-    @patch('requests.get')
+    @patch.object(edh_utils._SESSION, 'get')
     def test_download_invalid_json_response(self, mock_get):
         """Test that invalid JSON response raises error."""
         mock_response = Mock()
@@ -166,7 +173,7 @@ class TestEDHUtils(unittest.TestCase):
 
         self.assertIn("Invalid JSON", str(cm.exception))
 
-    @patch('requests.get')
+    @patch.object(edh_utils._SESSION, 'get')
     def test_download_api_error_response(self, mock_get):
         """Test that API error response is handled."""
         mock_response = Mock()
@@ -179,7 +186,7 @@ class TestEDHUtils(unittest.TestCase):
 
         self.assertIn("EDH API error", str(cm.exception))
 
-    @patch('requests.get')
+    @patch.object(edh_utils._SESSION, 'get')
     def test_download_empty_inscriptions_response(self, mock_get):
         """Test that empty inscriptions response raises error."""
         mock_response = Mock()
@@ -192,6 +199,288 @@ class TestEDHUtils(unittest.TestCase):
 
         self.assertIn("No inscription found", str(cm.exception))
 
+    def test_session_retries_transient_errors(self):
+        """Test that the shared session retries transient server errors."""
+        adapter = edh_utils._SESSION.get_adapter(EDH_API_BASE)
+
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    def test_persistent_server_error_raises_http_error(self):
+        """Test that a 503 that outlasts the retries surfaces as the HTTP error."""
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        requests_seen = []
+
+        class UnavailableHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_seen.append(self.path)
+                self.send_response(503)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), UnavailableHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        api_base = f"http://127.0.0.1:{server.server_port}"
+        with patch.object(edh_utils, 'EDH_API_BASE', api_base):
+            with self.assertRaises(edh_utils.requests.HTTPError) as cm:
+                download_edh_inscription("HD000001", self.temp_dir)
+
+        self.assertIn("503 Server Error", str(cm.exception))
+        self.assertEqual(len(requests_seen), 3)
+
+    def test_encode_json_matches_stdlib(self):
+        """Test that saved JSON matches json.dump output with or without orjson."""
+        data = {"inscriptions": [{"id": "HD000001", "text": "Dis Manibus Āuli", "n": [1, 2.5]}]}
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+        self.assertEqual(edh_utils._encode_json(data), expected)
+        with patch.object(edh_utils, 'orjson', None):
+            self.assertEqual(edh_utils._encode_json(data), expected)
+
+    def test_encode_json_matches_stdlib_for_unusual_floats(self):
+        """Test that exponent-form and non-finite floats are saved as json writes them."""
+        data = {"items": [{"x": 1e-7, "y": 1e20, "z": [float('nan'), float('inf')]}]}
+
+        self.assertEqual(edh_utils._encode_json(data),
+                         json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
+        self.assertEqual(edh_utils._encode_json(data, compact=True),
+                         json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_download_uses_response_cache(self, mock_get):
+        """Test that a cached response is reused instead of refetched."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = self.sample_response
+        mock_get.return_value = mock_response
+        cache_dir = str(self.temp_path / "cache")
+
+        download_edh_inscription("HD000001", self.temp_dir, cache_dir=cache_dir)
+        output_file = download_edh_inscription("HD000001", self.temp_dir, cache_dir=cache_dir)
+
+        self.assertEqual(mock_get.call_count, 1)
+        with open(output_file, 'r') as f:
+            self.assertEqual(json.load(f), self.sample_response)
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_download_compact_json(self, mock_get):
+        """Test that compact=True writes JSON without indentation."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = self.sample_response
+        mock_get.return_value = mock_response
+
+        output_file = download_edh_inscription("HD000001", self.temp_dir, compact=True)
+
+        content = Path(output_file).read_text(encoding='utf-8')
+        self.assertNotIn('\n', content)
+        self.assertEqual(json.loads(content), self.sample_response)
+
+
+class TestEDHSearch(unittest.TestCase):
+    """Test cases for EDH search and bulk saving."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _page_responses(self, total, max_limit=None, reject_above=None):
+        """Build mock search responses that page through `total` items."""
+        def fake_get(url, params=None, timeout=None):
+            offset, limit = params['offset'], params['limit']
+            response = Mock()
+            if reject_above and limit > reject_above:
+                response.status_code = 400
+                return response
+            if max_limit:
+                limit = min(limit, max_limit)
+            items = [{'id': f"HD{n:06d}", 'text': f"TEXT {n}"}
+                     for n in range(offset, min(offset + limit, total))]
+            response.status_code = 200
+            response.json.return_value = {'total': total, 'items': items}
+            return response
+        return fake_get
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_saves_items_from_every_page(self, mock_get):
+        """Test that items from all pages are saved in search order."""
+        mock_get.side_effect = self._page_responses(total=45)
+
+        saved = search_edh_inscriptions(self.temp_dir, province='Dalmatia',
+                                        max_results=100, workers=4)
+
+        self.assertEqual(len(saved), 45)
+        self.assertEqual(saved[0], str(self.temp_path / "HD000000.json"))
+        self.assertEqual(saved[-1], str(self.temp_path / "HD000044.json"))
+        with open(saved[10], 'r') as f:
+            self.assertEqual(json.load(f)['text'], "TEXT 10")
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_respects_max_results(self, mock_get):
+        """Test that no more than max_results items are saved."""
+        mock_get.side_effect = self._page_responses(total=500)
+
+        saved = search_edh_inscriptions(self.temp_dir, country='Italy',
+                                        max_results=30)
+
+        self.assertEqual(len(saved), 30)
+        self.assertEqual(len(list(self.temp_path.glob('*.json'))), 30)
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_uses_large_pages(self, mock_get):
+        """Test that a search fits in one request when the page is large enough."""
+        mock_get.side_effect = self._page_responses(total=45)
+
+        search_edh_inscriptions(self.temp_dir, province='Dalmatia', max_results=100)
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_get.call_args[1]['params']['limit'], 100)
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_falls_back_when_limit_rejected(self, mock_get):
+        """Test that a rejected page size falls back to the EDH default."""
+        mock_get.side_effect = self._page_responses(total=45, reject_above=20)
+
+        saved = search_edh_inscriptions(self.temp_dir, province='Dalmatia',
+                                        max_results=100)
+
+        self.assertEqual(len(saved), 45)
+        self.assertEqual(mock_get.call_args[1]['params']['limit'], 20)
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_handles_capped_pages(self, mock_get):
+        """Test that a server capping the page size does not skip items."""
+        mock_get.side_effect = self._page_responses(total=45, max_limit=20)
+
+        saved = search_edh_inscriptions(self.temp_dir, province='Dalmatia',
+                                        max_results=100)
+
+        self.assertEqual(len(saved), 45)
+        self.assertEqual(len(set(saved)), 45)
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_accepts_spaced_bbox(self, mock_get):
+        """Test that bbox coordinates may contain spaces and exponents."""
+        mock_get.side_effect = self._page_responses(total=0)
+
+        search_edh_inscriptions(self.temp_dir, bbox="12.4, 41.8, 1.25e1, 42")
+
+        self.assertEqual(mock_get.call_args[1]['params']['bbox'],
+                         "12.4,41.8,1.25e1,42")
+
+    def test_search_rejects_invalid_bbox(self):
+        """Test that malformed bounding boxes raise ValueError."""
+        for bbox in ("12.4,41.8,12.6", "a,b,c,d", "12,41,nan,42"):
+            with self.assertRaises(ValueError) as cm:
+                search_edh_inscriptions(self.temp_dir, bbox=bbox)
+            self.assertIn("Invalid bbox format", str(cm.exception))
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_reuses_cached_pages(self, mock_get):
+        """Test that repeating a search with a cache makes no new requests."""
+        mock_get.side_effect = self._page_responses(total=45)
+        cache_dir = str(self.temp_path / "cache")
+
+        first = search_edh_inscriptions(self.temp_dir, province='Dalmatia',
+                                        cache_dir=cache_dir)
+        calls = mock_get.call_count
+        second = search_edh_inscriptions(self.temp_dir, province='Dalmatia',
+                                         cache_dir=cache_dir)
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_get.call_count, calls)
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_refetches_stale_cache(self, mock_get):
+        """Test that cache entries older than the max age are ignored."""
+        mock_get.side_effect = self._page_responses(total=5)
+        cache_dir = self.temp_path / "cache"
+
+        search_edh_inscriptions(self.temp_dir, province='Dalmatia', cache_dir=str(cache_dir))
+        stale = edh_utils.time.time() - edh_utils.RESPONSE_CACHE_MAX_AGE - 60
+        for entry in cache_dir.rglob('*.json'):
+            os.utime(entry, (stale, stale))
+        search_edh_inscriptions(self.temp_dir, province='Dalmatia', cache_dir=str(cache_dir))
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_does_not_cache_error_payload(self, mock_get):
+        """Test that a page without a list of items is not cached."""
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {'error': 'backend unavailable'}
+        mock_get.return_value = response
+        cache_dir = self.temp_path / "cache"
+
+        saved = search_edh_inscriptions(self.temp_dir, province='Dalmatia',
+                                        cache_dir=str(cache_dir))
+        search_edh_inscriptions(self.temp_dir, province='Dalmatia',
+                                cache_dir=str(cache_dir))
+
+        self.assertEqual(saved, [])
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(list(cache_dir.rglob('*.json')), [])
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_reuses_write_pool(self, mock_get):
+        """Test that repeated searches share one writer thread pool."""
+        mock_get.side_effect = self._page_responses(total=5)
+
+        search_edh_inscriptions(self.temp_dir, province='Dalmatia', workers=3)
+        pool = edh_utils._WRITE_POOL
+        search_edh_inscriptions(self.temp_dir, province='Noricum', workers=3)
+
+        self.assertIsNotNone(pool)
+        self.assertIs(edh_utils._WRITE_POOL, pool)
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_failed_write_leaves_no_partial_files(self, mock_get):
+        """Test that a failed write skips the item and leaves no temporary file."""
+        mock_get.side_effect = self._page_responses(total=3)
+
+        with patch.object(edh_utils.os, 'replace', side_effect=OSError("disk full")):
+            saved = search_edh_inscriptions(self.temp_dir, province='Dalmatia')
+
+        self.assertEqual(saved, [])
+        self.assertEqual(list(self.temp_path.iterdir()), [])
+
+    @patch.object(edh_utils._SESSION, 'get')
+    def test_search_skips_unencodable_record(self, mock_get):
+        """Test that a record with a lone surrogate is skipped, not fatal."""
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = json.loads(
+            '{"total": 2, "items": [{"id": "HD000001", "text": "\\ud800"},'
+            ' {"id": "HD000002", "text": "Dis Manibus"}]}'
+        )
+        mock_get.return_value = response
+
+        saved = search_edh_inscriptions(self.temp_dir, province='Dalmatia')
+
+        self.assertEqual(saved, [str(self.temp_path / "HD000002.json")])
+        self.assertEqual([p.name for p in self.temp_path.iterdir()], ["HD000002.json"])
+
+    def test_search_requires_parameters(self):
+        """Test that a search without parameters raises ValueError."""
+        with self.assertRaises(ValueError):
+            search_edh_inscriptions(self.temp_dir)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,7 +4,9 @@ Tests for grammar pattern extraction (Phase 1).
 import unittest
 from latinepi.grammar_patterns import (
     extract_with_grammar_templates,
-    extract_unknown_names_by_position
+    extract_with_grammar_templates_batch,
+    extract_unknown_names_by_position,
+    _match_multiple_dedicators
 )
 
 
@@ -57,6 +59,31 @@ class TestGrammarPatterns(unittest.TestCase):
         self.assertTrue('marcus' in dedicator_lower or 'marcvs' in dedicator_lower)
         self.assertTrue('antonius' in dedicator_lower or 'antonivs' in dedicator_lower)
 
+    def test_keyword_spelling_variants(self):
+        """Test that V/U and case variants of template keywords still match."""
+        for text in ("D M VIBIAE SABINAE CONIVGI", "d m vibiae sabinae coniugi"):
+            entities = extract_with_grammar_templates(text)
+            self.assertEqual(entities['deceased_relationship']['value'], 'wife')
+
+        entities = extract_with_grammar_templates("GAIUS IULIUS CURAVIT")
+        self.assertIn('dedicator', entities)
+
+    def test_batch_matches_single_text_extraction(self):
+        """Test that batch extraction returns per-text results in input order."""
+        texts = [
+            "D M VIBIAE SABINAE FILIAE PIISSIMAE",
+            "VIBIUS PAULUS PATER FECIT",
+            "GAIUS IULIUS CAESARIS FILIUS",
+            "",
+        ] * 20
+        expected = [extract_with_grammar_templates(text) for text in texts]
+
+        self.assertEqual(extract_with_grammar_templates_batch(texts, workers=1), expected)
+        self.assertEqual(
+            extract_with_grammar_templates_batch(texts, workers=2, chunksize=16),
+            expected
+        )
+
     def test_multiple_dedicators_et_pattern(self):
         """Test extraction of multiple dedicators with ET."""
         text = "VIBIUS PAULUS PATER FECIT"  # Simplified to test basic extraction
@@ -66,6 +93,16 @@ class TestGrammarPatterns(unittest.TestCase):
         # The complex multi-dedicator pattern is handled by Phase 3 (dependency parsing)
         self.assertGreater(len(entities), 0)
 
+    def test_match_multiple_dedicators_checks_each_et(self):
+        """Test that the ET split finds a match after an earlier non-matching ET."""
+        text = "D ET M VIBIUS PAULUS PATER ET VIBIA TERTULLA MATER FECERVNT"
+
+        self.assertEqual(
+            _match_multiple_dedicators(text),
+            ('VIBIUS', 'PAULUS', 'PATER', 'VIBIA', 'TERTULLA', 'MATER')
+        )
+        self.assertIsNone(_match_multiple_dedicators("VIBIUS PAULUS PATER ET VIBIA FECERVNT"))
+
     def test_patronymic_f_abbreviation(self):
         """Test extraction of patronymic with F. abbreviation."""
         text = "MARCUS GAII F POMPEIUS"
@@ -127,6 +164,14 @@ class TestGrammarPatterns(unittest.TestCase):
             self.assertGreaterEqual(confidence, 0.0)
             self.assertLessEqual(confidence, 1.0)
 
+    def test_precomputed_uppercase_text(self):
+        """Test that passing text.upper() gives the same result as computing it."""
+        text = "d m Vibiae Sabinae filiae Vibius Paulus pater fecit"
+        self.assertEqual(
+            extract_with_grammar_templates(text, text.upper()),
+            extract_with_grammar_templates(text)
+        )
+
     def test_empty_text(self):
         """Test extraction from empty text."""
         text = ""
@@ -2,7 +2,26 @@
 Tests for hybrid parser integration.
 """
 import unittest
-from latinepi.hybrid_parser import HybridLatinParser, extract_entities_hybrid
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from latinepi.hybrid_parser import (
+    HybridLatinParser,
+    extract_entities_hybrid,
+    extract_entities_hybrid_batch,
+    extract_entities_hybrid_many,
+    preload_cltk
+)
+from latinepi.morphology import LatinMorphologyAnalyzer
+
+
+def _analyzer_with_doc(words):
+    """Build a morphology analyzer whose CLTK pipeline returns a fixed document."""
+    analyzer = LatinMorphologyAnalyzer()
+    analyzer._nlp = Mock()
+    analyzer._nlp.analyze.return_value = SimpleNamespace(words=words, sentences=[])
+    analyzer._initialized = True
+    return analyzer
 
 
 class TestHybridParser(unittest.TestCase):
@@ -91,6 +110,132 @@ class TestHybridParser(unittest.TestCase):
         self.assertGreater(len(entities), 0)
         self.assertIn('status', entities)
 
+    def test_merge_entities_in_place(self):
+        """Test that merging updates the existing dict, keeping the higher confidence."""
+        existing = {
+            'dedicator': {'value': 'Paulus', 'confidence': 0.75},
+            'status': {'value': 'dis manibus', 'confidence': 0.95},
+        }
+        new = {
+            'dedicator': {'value': 'Vibius Paulus', 'confidence': 0.85},
+            'status': {'value': 'dis manibus sacrum', 'confidence': 0.90},
+        }
+
+        merged = self.parser_basic._merge_entities(existing, new)
+
+        self.assertIs(merged, existing)
+        self.assertEqual(merged['dedicator']['value'], 'Vibius Paulus')
+        self.assertEqual(merged['status']['value'], 'dis manibus')
+        self.assertIs(self.parser_basic._merge_entities(existing, {}), existing)
+
+    def test_merge_entities_records_tied_alternatives(self):
+        """Test that verbose merges note equally confident values from later phases."""
+        existing = {'dedicator': {'value': 'Paulus', 'confidence': 0.80}}
+        new = {'dedicator': {'value': 'Vibius Paulus', 'confidence': 0.80}}
+
+        merged = self.parser_basic._merge_entities(
+            existing, new, verbose=True, phase_name='grammar_templates'
+        )
+
+        self.assertEqual(merged['dedicator']['value'], 'Paulus')
+        self.assertEqual(
+            merged['dedicator']['alternative_extraction'],
+            [{'value': 'Vibius Paulus', 'phase': 'grammar_templates'}]
+        )
+
+    def test_phase_needs(self):
+        """Test when morphology and dependency parsing are requested."""
+        value = {'value': 'x', 'confidence': 0.9}
+        complete = {'deceased_name': value, 'dedicator': value, 'status': value}
+        sparse = {'deceased_name': value, 'dedicator': value}
+        coordinated = {'dedicator_1': value, 'dedicator_2': value}
+
+        self.assertFalse(self.parser_basic._needs_morphology(complete))
+        self.assertTrue(self.parser_basic._needs_morphology(sparse))
+        self.assertTrue(self.parser_basic._needs_morphology(
+            {'deceased_name': value, 'status': value, 'nomen': value}
+        ))
+        self.assertFalse(self.parser_basic._needs_dependencies(complete))
+        self.assertTrue(self.parser_basic._needs_dependencies(coordinated))
+        self.assertTrue(self.parser_basic._needs_dependencies(
+            {f'entity_{i}': value for i in range(9)}
+        ))
+
+    def test_consolidate_entities_groups_and_order(self):
+        """Test that grouped entities merge to their base name, best first."""
+        entities = {
+            'status': {'value': 'dis manibus', 'confidence': 0.95},
+            'dedicator_dependency': {'value': 'Paulus', 'confidence': 0.80},
+            'deceased_name_morphology': {'value': 'VIBIAE', 'confidence': 0.85},
+            'dedicator': {'value': 'Paulus', 'confidence': 0.80},
+        }
+
+        consolidated = self.parser_basic._consolidate_entities(entities)
+
+        self.assertEqual(list(consolidated), ['deceased_name', 'dedicator', 'status'])
+        dedicator = consolidated['dedicator']
+        self.assertEqual(
+            [source['source'] for source in dedicator['confidence_sources']],
+            ['dedicator', 'dedicator_dependency']
+        )
+        self.assertAlmostEqual(dedicator['confidence'], 0.85)
+        self.assertEqual(dedicator['agreement'], 'high')
+
+    def test_extract_entities_batch_matches_single(self):
+        """Test that batch extraction matches per-text extraction, in order."""
+        texts = [
+            "D M GAIVS IVLIVS CAESAR",
+            "D M VIBIAE SABINAE FILIAE VIBIUS PAULUS PATER FECIT",
+            "",
+        ]
+        batch = self.parser_basic.extract_entities_batch(texts)
+
+        self.assertEqual(len(batch), len(texts))
+        for text, entities in zip(texts, batch):
+            self.assertEqual(entities, self.parser_basic.extract_entities(text))
+
+    def test_extract_entities_batch_matches_single_with_morphology(self):
+        """Test that batched morphology matches per-text extraction."""
+        texts = ["D M VIBIAE", "D M GAIVS IVLIVS CAESAR", "D M VIBIAE"]
+        analyzer = _analyzer_with_doc([
+            SimpleNamespace(string='VIBIAE', lemma='Vibia', pos='PROPN',
+                            features=SimpleNamespace(case='Gen')),
+        ])
+        parser = HybridLatinParser(use_morphology=True, use_dependencies=False)
+        parser._morphology_analyzer = analyzer
+
+        batch = parser.extract_entities_batch(texts, verbose=True)
+
+        self.assertEqual(analyzer._nlp.analyze.call_count, 2)
+        for text, entities in zip(texts, batch):
+            self.assertEqual(entities, parser.extract_entities(text, verbose=True))
+        self.assertEqual(batch[0]['deceased_name']['value'], 'VIBIAE')
+
+    def test_extract_entities_hybrid_batch_function(self):
+        """Test the batch convenience function."""
+        results = extract_entities_hybrid_batch(
+            ["D M GAIVS IVLIVS CAESAR", "D M VIBIA TERTULLA FILIA FECIT"],
+            use_morphology=False,
+            use_dependencies=False
+        )
+
+        self.assertEqual(len(results), 2)
+        self.assertIn('status', results[0])
+        self.assertIn('status', results[1])
+
+    def test_extract_entities_hybrid_many_matches_batch(self):
+        """Test that extraction across worker processes keeps results in order."""
+        texts = [
+            "D M GAIVS IVLIVS CAESAR",
+            "D M VIBIA TERTULLA FILIA FECIT",
+            "D M MARCIA TVRPILIA",
+        ] * 3
+        options = {'use_morphology': False, 'use_dependencies': False}
+
+        results = extract_entities_hybrid_many(texts, workers=2, chunksize=2, **options)
+
+        self.assertEqual(results, extract_entities_hybrid_batch(texts, **options))
+
     def test_complex_inscription_hybrid(self):
         """Test complex inscription with multiple people."""
         text = "D M VIBIAE SABINAE FILIAE VIBIUS PAULUS PATER ET VIBIA TERTULLA MATER FECERUNT"
@@ -221,5 +366,18 @@ class TestHybridParserWithDependencies(unittest.TestCase):
         )
 
 
+class TestPreloadCLTK(unittest.TestCase):
+    """Test cases for CLTK preloading before worker processes start."""
+
+    def test_preload_without_cltk_features_is_noop(self):
+        """Test that preloading with no CLTK features does nothing."""
+        self.assertIsNone(preload_cltk(False, False))
+
+    def test_preload_tolerates_missing_cltk(self):
+        """Test that preloading never raises when CLTK is unavailable."""
+        # Either CLTK loads, or the failure is left for the hybrid parser
+        self.assertIsNone(preload_cltk(True, True))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,202 @@
+"""
+Tests for the morphology analyzer that do not require CLTK.
+"""
+import sys
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from latinepi import morphology
+from latinepi.morphology import LatinMorphologyAnalyzer, get_morphology_analyzer
+
+
+def _analyzer_with_doc(words, cache_size=512):
+    """Build an analyzer whose CLTK pipeline returns a fixed document."""
+    analyzer = LatinMorphologyAnalyzer(cache_size=cache_size)
+    analyzer._nlp = Mock()
+    analyzer._nlp.analyze.return_value = SimpleNamespace(words=words, sentences=[])
+    analyzer._initialized = True
+    return analyzer
+
+
+class TestMorphologyCache(unittest.TestCase):
+    """Test cases for the morphology analysis cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.words = [
+            SimpleNamespace(string='VIBIAE', lemma='Vibia', pos='PROPN',
+                            features=SimpleNamespace(case='Gen', gender='Fem',
+                                                     number='Sing')),
+        ]
+
+    def test_report_calls_share_one_analysis(self):
+        """Test that entity extraction and case analysis run CLTK once."""
+        analyzer = _analyzer_with_doc(self.words)
+
+        entities = analyzer.extract_entities_by_morphology("D M VIBIAE")
+        cases = analyzer.get_case_analysis("D  M<BR>VIBIAE")
+        valid = analyzer.validate_entity_with_morphology("D M VIBIAE", 'Gen')
+
+        self.assertEqual(entities['deceased_name_morphology']['value'], 'VIBIAE')
+        self.assertEqual(cases[0]['case'], 'Gen')
+        self.assertEqual(valid, (True, 0.10))
+        self.assertEqual(analyzer._nlp.analyze.call_count, 1)
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache is bounded by cache_size."""
+        analyzer = _analyzer_with_doc(self.words, cache_size=2)
+
+        for text in ["A", "B", "C", "A"]:
+            analyzer.analyze_text(text)
+
+        self.assertEqual(analyzer._nlp.analyze.call_count, 4)
+        self.assertEqual(list(analyzer._analysis_cache), ["C", "A"])
+
+    def test_failed_analysis_not_cached(self):
+        """Test that CLTK errors are retried rather than cached."""
+        analyzer = _analyzer_with_doc(self.words)
+        analyzer._nlp.analyze.side_effect = RuntimeError("tagger failed")
+
+        self.assertIn('error', analyzer.analyze_text("D M VIBIAE"))
+        analyzer.analyze_text("D M VIBIAE")
+
+        self.assertEqual(analyzer._nlp.analyze.call_count, 2)
+
+    def test_batch_analyzes_duplicates_once(self):
+        """Test that duplicate texts within a batch share one analysis."""
+        analyzer = _analyzer_with_doc(self.words, cache_size=0)
+
+        results = analyzer.extract_entities_by_morphology_batch(
+            ["D M VIBIAE", "A", "D M<BR>VIBIAE"]
+        )
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0], results[2])
+        self.assertIsNot(results[0], results[2])
+        self.assertEqual(analyzer._nlp.analyze.call_count, 2)
+
+    def test_cache_disabled(self):
+        """Test that cache_size=0 disables caching."""
+        analyzer = _analyzer_with_doc(self.words, cache_size=0)
+
+        analyzer.analyze_text("D M VIBIAE")
+        analyzer.analyze_text("D M VIBIAE")
+
+        self.assertEqual(analyzer._nlp.analyze.call_count, 2)
+
+
+class TestMorphologyRules(unittest.TestCase):
+    """Test cases for the morphological extraction rules."""
+
+    def test_normalize_collapses_breaks_and_whitespace(self):
+        """Test that <BR> markers and runs of whitespace become single spaces."""
+        analyzer = LatinMorphologyAnalyzer()
+        self.assertEqual(
+            analyzer._normalize("  D M<BR>GAIVS<BR/>  IVLIVS  "),
+            "D M GAIVS IVLIVS"
+        )
+
+    def test_words_with_missing_attributes(self):
+        """Test that words lacking optional attributes are skipped, not fatal."""
+        words = [
+            SimpleNamespace(string='ET'),
+            SimpleNamespace(string='PATRI', lemma='Pater',
+                            features=SimpleNamespace(case='Dat')),
+            SimpleNamespace(string='TERTULLA', pos='PROPN', features=None),
+            SimpleNamespace(string='SABINAE', pos='PROPN',
+                            features=SimpleNamespace(case='Gen')),
+            SimpleNamespace(string='ROMAE', pos='PROPN', lemma=None,
+                            features=SimpleNamespace(case='Abl')),
+        ]
+        analyzer = _analyzer_with_doc(words)
+
+        entities = analyzer.extract_entities_by_morphology("ET PATRI TERTULLA SABINAE ROMAE")
+
+        self.assertEqual(entities['deceased_name_morphology']['value'], 'SABINAE')
+        self.assertEqual(entities['relationship_morphology']['value'], 'father')
+        self.assertEqual(entities['relationship_morphology']['lemma'], 'pater')
+        self.assertEqual(entities['location_morphology']['value'], 'ROMAE')
+        self.assertNotIn('dedicator_morphology', entities)
+
+    def test_dedicator_needs_dedication_verb(self):
+        """Test that nominative names only count as dedicators with a verb."""
+        words = [
+            SimpleNamespace(string='PAULUS', pos='PROPN',
+                            features=SimpleNamespace(case='Nom')),
+        ]
+        analyzer = _analyzer_with_doc(words)
+
+        self.assertEqual(
+            analyzer.extract_entities_by_morphology("Paulus posuit")
+            ['dedicator_morphology']['value'],
+            'PAULUS'
+        )
+        # Verbs match as substrings, so REFECIT counts as FECIT
+        self.assertIn('dedicator_morphology',
+                      analyzer.extract_entities_by_morphology("PAULUS REFECIT"))
+        self.assertEqual(analyzer.extract_entities_by_morphology("PAULUS VIXIT"), {})
+
+
+class TestMorphologyInitialization(unittest.TestCase):
+    """Test cases for loading the CLTK pipeline once."""
+
+    def setUp(self):
+        """Install a fake CLTK whose pipeline takes a moment to load."""
+        def slow_nlp(**kwargs):
+            time.sleep(0.05)
+            return Mock()
+
+        self.nlp_class = Mock(side_effect=slow_nlp)
+        patcher = patch.dict(sys.modules, {'cltk': SimpleNamespace(NLP=self.nlp_class)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_initialization_loads_once(self):
+        """Test that racing threads share one CLTK pipeline."""
+        analyzer = LatinMorphologyAnalyzer()
+        threads = [threading.Thread(target=analyzer._ensure_initialized)
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(analyzer._initialized)
+        self.assertEqual(self.nlp_class.call_count, 1)
+
+    def test_warm_up_loads_in_background(self):
+        """Test that warm_up initializes CLTK from a single thread."""
+        analyzer = LatinMorphologyAnalyzer()
+
+        analyzer.warm_up()
+        analyzer.warm_up()
+        analyzer._warm_up_thread.join()
+
+        self.assertTrue(analyzer._initialized)
+        self.assertEqual(self.nlp_class.call_count, 1)
+
+    def test_wait_for_warm_up(self):
+        """Test that wait_for_warm_up returns once the pipeline is loaded."""
+        analyzer = LatinMorphologyAnalyzer()
+        analyzer.wait_for_warm_up()
+
+        analyzer.warm_up()
+        analyzer.wait_for_warm_up()
+
+        self.assertFalse(analyzer._warm_up_thread.is_alive())
+        self.assertFalse(analyzer._init_lock.locked())
+        self.assertTrue(analyzer._initialized)
+
+    def test_singleton(self):
+        """Test that get_morphology_analyzer returns one shared instance."""
+        with patch.object(morphology, '_MORPHOLOGY_ANALYZER', None):
+            first = get_morphology_analyzer()
+            self.assertIs(get_morphology_analyzer(), first)
+            self.assertIs(morphology._MORPHOLOGY_ANALYZER, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests for batch processing across worker processes.
+"""
+import unittest
+
+from latinepi.parallel import iter_batch_results
+
+
+def _lengths(batch):
+    """Return the length of each item; a module-level function workers can run."""
+    return [len(item) for item in batch]
+
+
+class TestIterBatchResults(unittest.TestCase):
+    """Test cases for iter_batch_results."""
+
+    def test_pool_results_in_input_order(self):
+        """Test that batches from a lazy iterator come back in order."""
+        items = ('x' * (i % 7) for i in range(50))
+
+        results = list(iter_batch_results(_lengths, items, workers=2, batch_size=4))
+
+        self.assertEqual([len(batch) for batch, _ in results], [4] * 12 + [2])
+        self.assertEqual(
+            [length for _, lengths in results for length in lengths],
+            [i % 7 for i in range(50)]
+        )
+
+    def test_single_batch_runs_in_process(self):
+        """Test that one batch is processed here, without a pool."""
+        calls = []
+
+        def record(batch):
+            calls.append(batch)
+            return batch
+
+        results = list(iter_batch_results(record, ['a', 'b'], workers=4, batch_size=8))
+
+        self.assertEqual(results, [(['a', 'b'], ['a', 'b'])])
+        self.assertEqual(calls, [['a', 'b']])
+
+    def test_empty_input(self):
+        """Test that no batches are yielded for empty input."""
+        self.assertEqual(list(iter_batch_results(_lengths, [], workers=2)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
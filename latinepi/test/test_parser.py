@@ -5,8 +5,12 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from latinepi.parser import read_inscriptions, extract_entities
+from latinepi import parser
+from latinepi.parser import (
+    read_inscriptions, read_inscriptions_counted, read_inscriptions_iter, extract_entities
+)
 
 
 class TestParser(unittest.TestCase):
@@ -108,6 +112,27 @@ class TestParser(unittest.TestCase):
             read_inscriptions(str(json_file))
         self.assertIn("JSON parsing error", str(context.exception))
 
+    def test_json_reading_without_orjson(self):
+        """Test that the standard library fallback reads and reports the same."""
+        from unittest.mock import patch
+        import latinepi.parser as parser
+
+        json_file = self.temp_path / "test.json"
+        json_file.write_text('[{"id": 1, "text": "D M IVLIA", "age": NaN}]', encoding='utf-8')
+        bad_file = self.temp_path / "bad.json"
+        bad_file.write_text('{"text": "D M"', encoding='utf-8')
+
+        results = []
+        for orjson in (parser.orjson, None):
+            with patch.object(parser, 'orjson', orjson):
+                records = read_inscriptions(str(json_file))
+                with self.assertRaises(ValueError) as context:
+                    read_inscriptions(str(bad_file))
+                results.append((records[0]['text'], str(context.exception)))
+
+        self.assertEqual(results[0], results[1])
+        self.assertIn("JSON parsing error at line 1", results[0][1])
+
     def test_json_with_invalid_structure(self):
         """Test that ValueError is raised for JSON with wrong structure."""
         json_file = self.temp_path / "bad.json"
@@ -149,6 +174,78 @@ class TestParser(unittest.TestCase):
         self.assertEqual(result[0]['text'], 'D M, GAIVS "IULIUS" CAESAR')
         self.assertEqual(result[0]['location'], 'Rome, Italy')
 
+    def test_csv_ragged_rows_match_dictreader(self):
+        """Test that short, long and blank rows are read as DictReader reads them."""
+        csv_file = self.temp_path / "ragged.csv"
+        csv_file.write_text("id,text,location\n1,D M\n\n2,D M,Rome,extra\n")
+
+        result = read_inscriptions(str(csv_file))
+
+        self.assertEqual(result, [
+            {'id': '1', 'text': 'D M', 'location': None},
+            {'id': '2', 'text': 'D M', 'location': 'Rome', None: ['extra']},
+        ])
+
+    def test_read_inscriptions_iter_streams_csv(self):
+        """Test that CSV rows are yielded lazily in file order."""
+        csv_file = self.temp_path / "test.csv"
+        csv_file.write_text("id,text\n1,D M GAIVS\n2,D M MARCIA\n")
+
+        rows = read_inscriptions_iter(str(csv_file))
+        self.assertEqual(next(rows)['id'], '1')
+        self.assertEqual([row['text'] for row in rows], ['D M MARCIA'])
+
+    def test_read_inscriptions_iter_matches_read_inscriptions(self):
+        """Test that the iterator yields the same records for JSON input."""
+        json_file = self.temp_path / "test.json"
+        json_file.write_text(json.dumps([{"id": 1, "text": "A"}, {"id": 2, "text": "B"}]))
+
+        self.assertEqual(
+            list(read_inscriptions_iter(str(json_file))),
+            read_inscriptions(str(json_file))
+        )
+
+    def test_read_inscriptions_iter_empty_csv(self):
+        """Test that an empty CSV raises ValueError once iteration finishes."""
+        csv_file = self.temp_path / "empty.csv"
+        csv_file.write_text("id,text,location\n")
+
+        with self.assertRaises(ValueError) as context:
+            list(read_inscriptions_iter(str(csv_file)))
+        self.assertIn("empty or contains no data rows", str(context.exception))
+
+    def test_read_inscriptions_counted(self):
+        """Test that counts match the records read, skipping blank CSV lines."""
+        csv_file = self.temp_path / "test.csv"
+        csv_file.write_text("id,text\n1,D M\n\n2,D M,extra\n")
+        json_file = self.temp_path / "test.json"
+        json_file.write_text(json.dumps([{"id": 1}, {"id": 2}, {"id": 3}]))
+
+        total, records = read_inscriptions_counted(str(csv_file))
+        self.assertEqual(total, 2)
+        self.assertEqual(list(records), read_inscriptions(str(csv_file)))
+        total, records = read_inscriptions_counted(str(json_file))
+        self.assertEqual(total, 3)
+        self.assertEqual(list(records), read_inscriptions(str(json_file)))
+
+        empty_file = self.temp_path / "empty.csv"
+        empty_file.write_text("id,text\n")
+        with self.assertRaises(ValueError):
+            read_inscriptions_counted(str(empty_file))
+
+    def test_read_inscriptions_counted_parses_json_once(self):
+        """Test that a JSON file is decoded once for both count and records."""
+        json_file = self.temp_path / "test.json"
+        json_file.write_text(json.dumps([{"id": 1}, {"id": 2}]))
+
+        with patch.object(parser, '_loads_json', wraps=parser._loads_json) as loads:
+            total, records = read_inscriptions_counted(str(json_file))
+            records = list(records)
+
+        self.assertEqual(loads.call_count, 1)
+        self.assertEqual(total, 2)
+        self.assertEqual(records, [{"id": 1}, {"id": 2}])
+
     def test_json_with_nested_fields(self):
         """Test reading JSON with various field types."""
         json_file = self.temp_path / "test.json"
@@ -325,6 +422,25 @@ class TestParser(unittest.TestCase):
         self.assertIn('tribe', result)
         self.assertEqual(result['tribe']['value'], 'Lemonia')
 
+    def test_extract_names_match_whole_words_only(self):
+        """Test that name patterns match whole words, including V/U variants."""
+        result = extract_entities("IVLIAE SEVERAE FILIAE")
+        self.assertEqual(result['nomen']['value'], 'Iulia')
+        self.assertEqual(result['cognomen']['value'], 'Severa')
+        self.assertEqual(result['relationships']['value'], 'daughter')
+
+        result = extract_entities("IVLIANVS FILIABVS")
+        self.assertNotIn('nomen', result)
+        self.assertNotIn('relationships', result)
+
+    def test_extract_pattern_order_beats_text_order(self):
+        """Test that the earlier table entry wins wherever it appears in the text."""
+        result = extract_entities("FELIX CAESAR ROMAE CART HAGINE")
+
+        self.assertEqual(result['cognomen']['value'], 'Caesar')
+        self.assertEqual(result['location']['value'], 'Rom')
+        self.assertEqual(extract_entities("CART HAGINE")['location']['value'], 'Carthage')
+
 
 if __name__ == "__main__":
     unittest.main()